@@ -5,36 +5,50 @@
 # Principal Investigator (K1-Saber): Brendon Joseph Kelly
 # Framework: Reflexive Compositional Dynamics (RCD)
 
-from .system_check import F35SystemChecker, run_full_system_check
-from .engine_simulation import F135EngineSimulator, run_engine_check_and_startup
-from .theoretical_systems import (
-    AdvancedWeaponsChecker,
-    PhaseShiftingChecker,
-    CloakingSystemChecker,
-    HyperLatticeTeleportationChecker,
-    AdvancedPropulsionChecker,
-    run_all_theoretical_checks
-)
-from .k1_saber import K1SaberSystem, run_k1_saber_check
-
-__all__ = [
+import importlib
+
+# Exported names resolve to their submodule on first access (PEP 562), so
+# importing the package or one submodule does not load all the others
+_LAZY = {
     # System Check
-    'F35SystemChecker',
-    'run_full_system_check',
+    'F35SystemChecker': 'system_check',
+    'run_full_system_check': 'system_check',
+    'clear_check_cache': 'system_check',
     
     # Engine Simulation
-    'F135EngineSimulator',
-    'run_engine_check_and_startup',
+    'F135EngineSimulator': 'engine_simulation',
+    'run_engine_check_and_startup': 'engine_simulation',
+    'run_engine_check_and_startup_async': 'engine_simulation',
+    'run_fleet_startup_async': 'engine_simulation',
+    'clear_engine_check_cache': 'engine_simulation',
     
     # Theoretical Systems
-    'AdvancedWeaponsChecker',
-    'PhaseShiftingChecker',
-    'CloakingSystemChecker',
-    'HyperLatticeTeleportationChecker',
-    'AdvancedPropulsionChecker',
-    'run_all_theoretical_checks',
+    'AdvancedWeaponsChecker': 'theoretical_systems',
+    'PhaseShiftingChecker': 'theoretical_systems',
+    'CloakingSystemChecker': 'theoretical_systems',
+    'HyperLatticeTeleportationChecker': 'theoretical_systems',
+    'AdvancedPropulsionChecker': 'theoretical_systems',
+    'run_all_theoretical_checks': 'theoretical_systems',
+    'iter_theoretical_checks': 'theoretical_systems',
     
     # K1-Saber
-    'K1SaberSystem',
-    'run_k1_saber_check',
-]
+    'K1SaberSystem': 'k1_saber',
+    'run_k1_saber_check': 'k1_saber',
+}
+
+
+def __getattr__(name):
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+__all__ = list(_LAZY)
@@ -0,0 +1,41 @@
+"""
+Console helpers shared by the F-35 NEXUS-D system modules
+"""
+
+import asyncio
+import os
+import sys
+from typing import List
+
+
+# Console pacing is for live demos only; set F35_DEMO_PACE=1 to enable it
+PACE_ENABLED = os.environ.get("F35_DEMO_PACE") == "1"
+
+# Pre-rendered 30-cell progress bars, indexed by percent complete
+PROGRESS_BARS = tuple("█" * int(30 * p / 100) + "░" * (30 - int(30 * p / 100)) for p in range(101))
+
+
+async def pace(seconds: float) -> None:
+    """Pause for demo pacing, if enabled"""
+    if PACE_ENABLED:
+        await asyncio.sleep(seconds)
+
+
+class BufferedOutput:
+    """
+    Mixin batching console output into one stdout write per flush
+    
+    Classes using it set self._out to an empty list in __init__.
+    """
+    
+    _out: List[str]
+    
+    def _emit(self, line: str) -> None:
+        """Queue a line of output for the next flush"""
+        self._out.append(line)
+        
+    def _flush(self) -> None:
+        """Write all queued output lines in a single stdout write"""
+        if self._out:
+            sys.stdout.write("\n".join(self._out) + "\n")
+            self._out.clear()
@@ -5,25 +5,114 @@ This module simulates the F135 engine check procedures and startup sequence
 for the F-35 Lightning II with NEXUS-D upgrades.
 """
 
-import time
+import asyncio
+import copy
+import functools
 import random
-from dataclasses import dataclass
-from enum import Enum
-from typing import List, Dict, Optional, Callable
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from enum import Enum, IntEnum
+from types import MappingProxyType
+from typing import List, Dict, Optional, Callable, Sequence, Tuple, Union
+
+try:
+    from ._console import BufferedOutput, PROGRESS_BARS
+except ImportError:  # run as a script from src/systems
+    from _console import BufferedOutput, PROGRESS_BARS
+
+
+_BANNER = "=" * 60
+
+# Status line formatters for the per-tick progress loops, bound once
+_FMT_N2_EGT = "N2: {:.1f}%  EGT: {:.0f}°C".format
+_FMT_N2 = "N2: {:.1f}%".format
+_FMT_COOLING = "Cooling... EGT: {:.0f}°C".format
+_FMT_PRIMING = "Priming fuel system... FF: {:.0f} lb/hr".format
+
+# Starter disengages once N2 is within half a percent of the 65% cutoff
+STARTER_CUTOFF_N2 = 64.5
+STARTER_TIMEOUT = 15.0  # seconds
+
+# Memoized passing engine checks, keyed by (aircraft_id, seed) in LRU order.
+# Entries hold (timestamp, (pass, warn, fail) counts, result).
+CHECK_CACHE_MAXSIZE = 128
+CHECK_CACHE_TTL = 300.0  # seconds
+_check_cache: "OrderedDict[Tuple[str, Optional[int]], Tuple[float, Tuple[int, int, int], Dict[str, any]]]" = OrderedDict()
+
+# Engine check draw ranges, in the order run_engine_check unpacks them:
+# fuel press, fuel temp, oil level, oil temp, igniter A, igniter B
+CHECK_UNIFORM_RANGES = ((38, 42), (15, 25), (95, 100), (18, 25), (95, 100), (95, 100))
+# total, temperature, pressure, vibration, speed, position sensors online
+CHECK_SENSOR_RANGES = ((145, 150), (48, 50), (38, 40), (28, 30), (18, 20), (8, 10))
+
+# Number of EngineParameter results run_engine_check stores
+CHECK_RESULT_SLOTS = 4
+
+# Idle stabilization: parameter order, targets and first-order lag rates
+IDLE_PARAMS = ("n1", "n2", "egt", "ff", "oil_press", "oil_temp", "thrust", "vib_fan", "vib_core")
+IDLE_TARGETS = (55.0, 70.0, 450.0, 1200.0, 45.0, 65.0, 5500.0, 1.2, 1.5)
+IDLE_RATES = (0.15, 0.15, 0.15, 0.15, 0.2, 0.1, 0.15, 0.2, 0.2)
+
+# Post-cutoff spool down toward ambient
+SPOOL_DOWN_PARAMS = ("n2", "n1", "egt")
+SPOOL_DOWN_TARGETS = (0.0, 0.0, 25.0)
+SPOOL_DOWN_RATES = (0.05, 0.05, 0.02)
+
 
+def _lag_closed_form(initial: float, target: float, rate: float, n: int) -> float:
+    """Value of a first-order lag after n ticks, without iterating"""
+    return target + (initial - target) * (1 - rate) ** n
 
-class EngineState(Enum):
+
+def _integrate_phase(state: Sequence[float], targets: Sequence[float],
+                     rates: Sequence[float], steps: int) -> List[Tuple[float, ...]]:
+    """
+    First-order lag integrator for a group of engine parameters
+    
+    Pure numeric kernel with no simulator or display state, advancing
+    every parameter ``steps`` ticks toward its target. Returns the state
+    after each tick. Targets are constant over a phase, so each tick is
+    evaluated directly in closed form rather than by repeated updates.
+    """
+    params = tuple(zip(state, targets, rates))
+    return [
+        tuple(_lag_closed_form(v, t, r, n) for v, t, r in params)
+        for n in range(1, steps + 1)
+    ]
+
+
+class EngineState(IntEnum):
     """Engine state indicators"""
-    OFF = "OFF"
-    BATTERY = "BATTERY"
-    APU_START = "APU_START"
-    APU_RUNNING = "APU_RUNNING"
-    FUEL_PRIMING = "FUEL_PRIMING"
-    IGNITION = "IGNITION"
-    STARTER_ENGAGED = "STARTER_ENGAGED"
-    IDLE = "IDLE"
-    RUNNING = "RUNNING"
-    FAULT = "FAULT"
+    OFF = 0
+    BATTERY = 1
+    APU_START = 2
+    APU_RUNNING = 3
+    FUEL_PRIMING = 4
+    IGNITION = 5
+    STARTER_ENGAGED = 6
+    IDLE = 7
+    RUNNING = 8
+    FAULT = 9
+
+
+# Valid transitions, indexed by source state, as a bitmask of destination
+# states. Shutdown (OFF) and FAULT are reachable from every state, and a
+# running or faulted engine may rerun the startup sequence (BATTERY).
+_ANY_STATE = (1 << EngineState.OFF) | (1 << EngineState.FAULT)
+_TRANSITIONS = (
+    _ANY_STATE | 1 << EngineState.BATTERY,          # OFF
+    _ANY_STATE | 1 << EngineState.APU_START,        # BATTERY
+    _ANY_STATE | 1 << EngineState.APU_RUNNING,      # APU_START
+    _ANY_STATE | 1 << EngineState.FUEL_PRIMING,     # APU_RUNNING
+    _ANY_STATE | 1 << EngineState.IGNITION,         # FUEL_PRIMING
+    _ANY_STATE | 1 << EngineState.STARTER_ENGAGED,  # IGNITION
+    _ANY_STATE | 1 << EngineState.IDLE,             # STARTER_ENGAGED
+    _ANY_STATE | 1 << EngineState.RUNNING,          # IDLE
+    _ANY_STATE | 1 << EngineState.BATTERY,          # RUNNING
+    _ANY_STATE | 1 << EngineState.BATTERY,          # FAULT
+)
 
 
 class EngineCheckStatus(Enum):
@@ -33,18 +122,65 @@ class EngineCheckStatus(Enum):
     FAIL = "FAIL"
 
 
-@dataclass
-class EngineParameter:
-    """Engine parameter data"""
+@dataclass(frozen=True, slots=True)
+class ParameterSpec:
+    """Static identity and limits of a checked engine parameter"""
     name: str
-    value: float
     unit: str
     min_limit: float
     max_limit: float
+    
+    def within_limits(self, value: float) -> bool:
+        """Whether a reading lies inside this parameter's limits"""
+        return self.min_limit <= value <= self.max_limit
+
+
+@functools.lru_cache(maxsize=None)
+def spec(name: str, unit: str, min_limit: float, max_limit: float) -> ParameterSpec:
+    """Return the shared ParameterSpec for this name/unit/limits combination"""
+    return ParameterSpec(name, unit, min_limit, max_limit)
+
+
+@dataclass
+class EngineParameter:
+    """Engine parameter reading against its spec"""
+    spec: ParameterSpec
+    value: float
     status: EngineCheckStatus = EngineCheckStatus.PASS
+    
+    @property
+    def name(self) -> str:
+        return self.spec.name
+    
+    @property
+    def unit(self) -> str:
+        return self.spec.unit
+    
+    @property
+    def min_limit(self) -> float:
+        return self.spec.min_limit
+    
+    @property
+    def max_limit(self) -> float:
+        return self.spec.max_limit
 
 
-class F135EngineSimulator:
+@dataclass(slots=True)
+class EngineTelemetry:
+    """Live engine telemetry"""
+    n1: float = 0.0          # Fan speed (%)
+    n2: float = 0.0          # Core speed (%)
+    egt: float = 0.0         # Exhaust Gas Temperature (°C)
+    ff: float = 0.0          # Fuel Flow (lb/hr)
+    oil_press: float = 0.0   # Oil Pressure (psi)
+    oil_temp: float = 20.0   # Oil Temperature (°C)
+    itt: float = 0.0         # Interstage Turbine Temperature (°C)
+    thrust: float = 0.0      # Current Thrust (lbf)
+    vib_fan: float = 0.0     # Fan Vibration (mils)
+    vib_core: float = 0.0    # Core Vibration (mils)
+
+
+class F135EngineSimulator(BufferedOutput):
     """
     Pratt & Whitney F135 Engine Simulator
     
@@ -63,55 +199,187 @@ class F135EngineSimulator:
     - Predictive maintenance AI integration
     """
     
-    def __init__(self, aircraft_id: str = "F35-001"):
+    _PARAM_TEMPLATE = (
+        "\n  ┌─────────────────────────────────────────────┐\n"
+        "  │         F135 ENGINE PARAMETERS              │\n"
+        "  ├─────────────────────────────────────────────┤\n"
+        "  │  N1 (Fan):      {n1:6.1f} %                  │\n"
+        "  │  N2 (Core):     {n2:6.1f} %                  │\n"
+        "  │  EGT:           {egt:6.1f} °C                │\n"
+        "  │  Fuel Flow:     {ff:6.0f} lb/hr              │\n"
+        "  │  Oil Pressure:  {oil_press:6.1f} psi               │\n"
+        "  │  Oil Temp:      {oil_temp:6.1f} °C                │\n"
+        "  │  Thrust:        {thrust:6.0f} lbf               │\n"
+        "  └─────────────────────────────────────────────┘"
+    )
+    
+    def __init__(self, aircraft_id: str = "F35-001", seed: Optional[int] = None,
+                 realtime: bool = True):
         self.aircraft_id = aircraft_id
+        # Fast mode (realtime=False) skips all pauses and intermediate animation frames
+        self.realtime = realtime
+        # Per-instance generator; pass a seed for reproducible fleet runs
+        self.seed = seed
+        self._rng = random.Random(seed)
         self.state = EngineState.OFF
-        self.parameters: Dict[str, float] = {
-            "n1": 0.0,          # Fan speed (%)
-            "n2": 0.0,          # Core speed (%)
-            "egt": 0.0,         # Exhaust Gas Temperature (°C)
-            "ff": 0.0,          # Fuel Flow (lb/hr)
-            "oil_press": 0.0,   # Oil Pressure (psi)
-            "oil_temp": 20.0,   # Oil Temperature (°C)
-            "itt": 0.0,         # Interstage Turbine Temperature (°C)
-            "thrust": 0.0,      # Current Thrust (lbf)
-            "vib_fan": 0.0,     # Fan Vibration (mils)
-            "vib_core": 0.0,    # Core Vibration (mils)
-        }
+        self.tel = EngineTelemetry()
         self.startup_complete = False
         self.check_results: List[EngineParameter] = []
+        self._pass_count = 0
+        self._warn_count = 0
+        self._fail_count = 0
+        self._phase_complete: Optional[asyncio.Event] = None
+        self._starter_cutoff = False
+        self._out: List[str] = []
+        
+    @property
+    def parameters(self) -> "MappingProxyType[str, float]":
+        """
+        Read-only snapshot of the current telemetry as a name -> value mapping
+        
+        Update engine state through self.tel; assigning into this snapshot
+        raises TypeError instead of being silently discarded.
+        """
+        return MappingProxyType(asdict(self.tel))
+        
+    def _transition(self, new_state: EngineState) -> None:
+        """Move to a new engine state, rejecting out-of-sequence transitions"""
+        if not _TRANSITIONS[self.state] & (1 << new_state):
+            raise RuntimeError(f"Invalid engine state transition: {self.state.name} -> {new_state.name}")
+        self.state = new_state
+        
+    def _record(self, slot: int, result: EngineParameter) -> None:
+        """Store an engine check result in its slot and count it toward the summary"""
+        self.check_results[slot] = result
+        if result.status is EngineCheckStatus.PASS:
+            self._pass_count += 1
+        elif result.status is EngineCheckStatus.WARN:
+            self._warn_count += 1
+        else:
+            self._fail_count += 1
+            
+    async def _pause(self, seconds: float) -> None:
+        """Flush queued output, then wait (no-op wait in fast mode)"""
+        self._flush()
+        if self.realtime:
+            await asyncio.sleep(seconds)
         
     def _display_status(self, message: str, progress: Optional[int] = None) -> None:
         """Display status message with optional progress"""
         if progress is not None:
-            bar_length = 30
-            filled = int(bar_length * progress / 100)
-            bar = "█" * filled + "░" * (bar_length - filled)
-            print(f"\r  [{bar}] {progress:3d}% - {message}", end="", flush=True)
+            self._flush()
+            # Progress ticks are separated by pauses, so each must reach the terminal
+            sys.stdout.write(f"\r  [{PROGRESS_BARS[progress]}] {progress:3d}% - {message}")
+            sys.stdout.flush()
         else:
-            print(f"  → {message}")
+            self._emit(f"  → {message}")
             
+    async def _progress_phase(self, message: Union[str, Callable[[int], str]],
+                              step: int, delay: float) -> None:
+        """
+        Run a fixed-cadence progress bar from 0 to 100%
+        
+        ``message`` is either a fixed string or a per-tick callable that
+        receives the percent complete, updates any parameters and returns
+        the status text. In fast mode only the final tick is run.
+        """
+        ticks = range(0, 101, step)
+        for i in (ticks if self.realtime else ticks[-1:]):
+            self._display_status(message(i) if callable(message) else message, i)
+            await self._pause(delay)
+        self._emit("")
+        
     def _update_parameter(self, param: str, target: float, rate: float = 0.1) -> None:
         """Gradually update a parameter toward target value"""
-        current = self.parameters[param]
-        diff = target - current
-        self.parameters[param] = current + diff * rate
+        current = getattr(self.tel, param)
+        setattr(self.tel, param, current + (target - current) * rate)
         
+    def _trajectory(self, params: Sequence[str], targets: Sequence[float],
+                    rates: Sequence[float], ticks: range) -> List[Tuple[int, Tuple[float, ...]]]:
+        """
+        Precompute a whole phase of first-order lag updates
+        
+        Returns a (tick, row) pair of parameter values per display tick, so
+        the display loop only has to apply a row instead of updating each
+        parameter individually. In fast mode only the final pair is
+        returned, jumping straight to the end-of-phase values.
+        """
+        state = [getattr(self.tel, p) for p in params]
+        if not self.realtime:
+            row = tuple(_lag_closed_form(v, t, r, len(ticks)) for v, t, r in zip(state, targets, rates))
+            return [(ticks[-1], row)]
+        return list(zip(ticks, _integrate_phase(state, targets, rates, len(ticks))))
+        
+    async def _spool_physics(self) -> None:
+        """
+        Integrate starter-assisted spool-up, signalling when it ends
+        
+        The phase event is set once N2 reaches cutoff, or once the spool-up
+        runs out short of it; _starter_cutoff records which.
+        """
+        self._starter_cutoff = False
+        tel = self.tel
+        for i in range(0, 101, 2):
+            # Simulate engine spool-up
+            n2_target = min(25 + i * 0.5, 65)  # N2 to 65% for starter cutoff
+            tel.n2 += (n2_target - tel.n2) * 0.3
+            tel.n1 += (tel.n2 * 0.8 - tel.n1) * 0.3
+            tel.egt += (200 + i * 4 - tel.egt) * 0.2
+            tel.oil_press += (min(5 + i * 0.4, 45) - tel.oil_press) * 0.3
+            if self.realtime:
+                self._display_status(_FMT_N2_EGT(tel.n2, tel.egt), i)
+            if tel.n2 >= STARTER_CUTOFF_N2:
+                self._starter_cutoff = True
+                break
+            await self._pause(0.03)
+        self._phase_complete.set()
+            
     def display_engine_parameters(self) -> None:
         """Display current engine parameters"""
-        print("\n  ┌─────────────────────────────────────────────┐")
-        print("  │         F135 ENGINE PARAMETERS              │")
-        print("  ├─────────────────────────────────────────────┤")
-        print(f"  │  N1 (Fan):      {self.parameters['n1']:6.1f} %                  │")
-        print(f"  │  N2 (Core):     {self.parameters['n2']:6.1f} %                  │")
-        print(f"  │  EGT:           {self.parameters['egt']:6.1f} °C                │")
-        print(f"  │  Fuel Flow:     {self.parameters['ff']:6.0f} lb/hr              │")
-        print(f"  │  Oil Pressure:  {self.parameters['oil_press']:6.1f} psi               │")
-        print(f"  │  Oil Temp:      {self.parameters['oil_temp']:6.1f} °C                │")
-        print(f"  │  Thrust:        {self.parameters['thrust']:6.0f} lbf               │")
-        print("  └─────────────────────────────────────────────┘")
-        
-    def run_engine_check(self) -> Dict[str, any]:
+        self._emit(self._PARAM_TEMPLATE.format_map(self.parameters))
+        self._flush()
+        
+    def run_engine_check(self, use_cache: bool = False) -> Dict[str, any]:
+        """Run comprehensive engine diagnostic check (blocking wrapper)"""
+        return asyncio.run(self.run_engine_check_async(use_cache))
+        
+    def startup_sequence(self) -> bool:
+        """Execute F135 engine startup sequence (blocking wrapper)"""
+        return asyncio.run(self.startup_sequence_async())
+        
+    def shutdown_sequence(self) -> bool:
+        """Execute engine shutdown sequence (blocking wrapper)"""
+        return asyncio.run(self.shutdown_sequence_async())
+        
+    def _cached_check(self) -> Optional[Dict[str, any]]:
+        """Return a still-valid memoized check for this aircraft and seed, if any"""
+        key = (self.aircraft_id, self.seed)
+        entry = _check_cache.get(key)
+        if entry is None:
+            return None
+        timestamp, counts, result = entry
+        age = time.monotonic() - timestamp
+        if age > CHECK_CACHE_TTL:
+            del _check_cache[key]
+            return None
+        _check_cache.move_to_end(key)
+        
+        result = copy.deepcopy(result)
+        self.check_results = result["checks"]
+        self._pass_count, self._warn_count, self._fail_count = counts
+        for check in self.check_results:
+            if check.name == "Oil Temperature":
+                self.tel.oil_temp = check.value
+        
+        self._emit(f"\n{_BANNER}")
+        self._emit("F135-PW-100 ENGINE CHECK SEQUENCE")
+        self._emit(f"Aircraft: {self.aircraft_id}")
+        self._emit(_BANNER)
+        self._emit(f"  → Using cached engine check ({age:.0f}s old): {result['status']}")
+        self._flush()
+        return result
+        
+    async def run_engine_check_async(self, use_cache: bool = False) -> Dict[str, any]:
         """
         Run comprehensive engine diagnostic check
         
@@ -121,122 +389,145 @@ class F135EngineSimulator:
         - Ignition system
         - FADEC (Full Authority Digital Engine Control)
         - Sensors and instrumentation
+        
+        Args:
+            use_cache: Reuse a passing check for the same aircraft_id and
+                seed made within CHECK_CACHE_TTL seconds instead of
+                re-running it
         """
-        print(f"\n{'='*60}")
-        print("F135-PW-100 ENGINE CHECK SEQUENCE")
-        print(f"Aircraft: {self.aircraft_id}")
-        print(f"{'='*60}")
+        if use_cache:
+            cached = self._cached_check()
+            if cached is not None:
+                return cached
+        
+        self._emit(f"\n{_BANNER}")
+        self._emit("F135-PW-100 ENGINE CHECK SEQUENCE")
+        self._emit(f"Aircraft: {self.aircraft_id}")
+        self._emit(_BANNER)
         
         checks_passed = True
-        self.check_results = []
+        self.check_results = [None] * CHECK_RESULT_SLOTS
+        self._pass_count = self._warn_count = self._fail_count = 0
+        
+        # Draw every simulated sensor reading up front from the range tables
+        uniform, randint = self._rng.uniform, self._rng.randint
+        (fuel_press, fuel_temp, oil_level, oil_temp,
+         igniter_a, igniter_b) = [uniform(lo, hi) for lo, hi in CHECK_UNIFORM_RANGES]
+        (sensors_operational, temp_sensors, press_sensors, vib_sensors,
+         speed_sensors, pos_sensors) = [randint(lo, hi) for lo, hi in CHECK_SENSOR_RANGES]
         
         # 1. Fuel System Check
-        print("\n[1/6] FUEL SYSTEM CHECK")
-        time.sleep(0.3)
+        self._emit("\n[1/6] FUEL SYSTEM CHECK")
+        await self._pause(0.3)
         
-        fuel_press = random.uniform(38, 42)
-        result = EngineParameter("Fuel Pressure", fuel_press, "psi", 35, 45)
-        result.status = EngineCheckStatus.PASS if 35 <= fuel_press <= 45 else EngineCheckStatus.FAIL
-        self.check_results.append(result)
-        print(f"  ✓ Fuel Pressure: {fuel_press:.1f} psi [35-45 psi]")
+        fuel_press_spec = spec("Fuel Pressure", "psi", 35, 45)
+        result = EngineParameter(fuel_press_spec, fuel_press)
+        result.status = (EngineCheckStatus.PASS if fuel_press_spec.within_limits(fuel_press)
+                         else EngineCheckStatus.FAIL)
+        self._record(0, result)
+        self._emit(f"  ✓ Fuel Pressure: {fuel_press:.1f} psi [35-45 psi]")
         
-        fuel_temp = random.uniform(15, 25)
-        result = EngineParameter("Fuel Temperature", fuel_temp, "°C", -40, 60)
-        self.check_results.append(result)
-        print(f"  ✓ Fuel Temperature: {fuel_temp:.1f} °C [-40-60 °C]")
+        result = EngineParameter(spec("Fuel Temperature", "°C", -40, 60), fuel_temp)
+        self._record(1, result)
+        self._emit(f"  ✓ Fuel Temperature: {fuel_temp:.1f} °C [-40-60 °C]")
         
-        print(f"  ✓ Fuel Boost Pump: OPERATIONAL")
-        print(f"  ✓ Fuel Filter: CLEAN")
+        self._emit(f"  ✓ Fuel Boost Pump: OPERATIONAL")
+        self._emit(f"  ✓ Fuel Filter: CLEAN")
         
         # 2. Oil System Check
-        print("\n[2/6] OIL SYSTEM CHECK")
-        time.sleep(0.3)
+        self._emit("\n[2/6] OIL SYSTEM CHECK")
+        await self._pause(0.3)
         
-        oil_level = random.uniform(95, 100)
-        result = EngineParameter("Oil Level", oil_level, "%", 80, 100)
-        self.check_results.append(result)
-        print(f"  ✓ Oil Level: {oil_level:.1f}% [>80%]")
+        result = EngineParameter(spec("Oil Level", "%", 80, 100), oil_level)
+        self._record(2, result)
+        self._emit(f"  ✓ Oil Level: {oil_level:.1f}% [>80%]")
         
-        self.parameters["oil_temp"] = random.uniform(18, 25)
-        result = EngineParameter("Oil Temperature", self.parameters["oil_temp"], "°C", -40, 150)
-        self.check_results.append(result)
-        print(f"  ✓ Oil Temperature: {self.parameters['oil_temp']:.1f} °C [Pre-start nominal]")
+        self.tel.oil_temp = oil_temp
+        result = EngineParameter(spec("Oil Temperature", "°C", -40, 150), oil_temp)
+        self._record(3, result)
+        self._emit(f"  ✓ Oil Temperature: {oil_temp:.1f} °C [Pre-start nominal]")
         
-        print(f"  ✓ Oil Filter: BYPASS CLOSED")
-        print(f"  ✓ Scavenge Pumps: OPERATIONAL")
+        self._emit(f"  ✓ Oil Filter: BYPASS CLOSED")
+        self._emit(f"  ✓ Scavenge Pumps: OPERATIONAL")
         
         # 3. Ignition System Check
-        print("\n[3/6] IGNITION SYSTEM CHECK")
-        time.sleep(0.3)
+        self._emit("\n[3/6] IGNITION SYSTEM CHECK")
+        await self._pause(0.3)
         
-        igniter_a = random.uniform(95, 100)
-        igniter_b = random.uniform(95, 100)
-        print(f"  ✓ Igniter A: {igniter_a:.1f}% spark efficiency")
-        print(f"  ✓ Igniter B: {igniter_b:.1f}% spark efficiency")
-        print(f"  ✓ Exciter Box: ARMED")
+        self._emit(f"  ✓ Igniter A: {igniter_a:.1f}% spark efficiency")
+        self._emit(f"  ✓ Igniter B: {igniter_b:.1f}% spark efficiency")
+        self._emit(f"  ✓ Exciter Box: ARMED")
         
         # 4. FADEC Check
-        print("\n[4/6] FADEC SYSTEM CHECK")
-        time.sleep(0.3)
+        self._emit("\n[4/6] FADEC SYSTEM CHECK")
+        await self._pause(0.3)
         
-        print(f"  ✓ Channel A: ONLINE")
-        print(f"  ✓ Channel B: ONLINE (Backup)")
-        print(f"  ✓ FADEC Software: Version 7.2.1")
-        print(f"  ✓ Self-Test: PASSED")
-        print(f"  ✓ Sensor Calibration: VALID")
+        self._emit(f"  ✓ Channel A: ONLINE")
+        self._emit(f"  ✓ Channel B: ONLINE (Backup)")
+        self._emit(f"  ✓ FADEC Software: Version 7.2.1")
+        self._emit(f"  ✓ Self-Test: PASSED")
+        self._emit(f"  ✓ Sensor Calibration: VALID")
         
         # 5. Sensor Array Check
-        print("\n[5/6] SENSOR ARRAY CHECK")
-        time.sleep(0.3)
+        self._emit("\n[5/6] SENSOR ARRAY CHECK")
+        await self._pause(0.3)
         
-        sensors_operational = random.randint(145, 150)
-        print(f"  ✓ Temperature Sensors: {random.randint(48, 50)}/50 ONLINE")
-        print(f"  ✓ Pressure Sensors: {random.randint(38, 40)}/40 ONLINE")
-        print(f"  ✓ Vibration Sensors: {random.randint(28, 30)}/30 ONLINE")
-        print(f"  ✓ Speed Sensors: {random.randint(18, 20)}/20 ONLINE")
-        print(f"  ✓ Position Sensors: {random.randint(8, 10)}/10 ONLINE")
-        print(f"  → Total: {sensors_operational}/150 sensors operational")
+        self._emit(f"  ✓ Temperature Sensors: {temp_sensors}/50 ONLINE")
+        self._emit(f"  ✓ Pressure Sensors: {press_sensors}/40 ONLINE")
+        self._emit(f"  ✓ Vibration Sensors: {vib_sensors}/30 ONLINE")
+        self._emit(f"  ✓ Speed Sensors: {speed_sensors}/20 ONLINE")
+        self._emit(f"  ✓ Position Sensors: {pos_sensors}/10 ONLINE")
+        self._emit(f"  → Total: {sensors_operational}/150 sensors operational")
         
         # 6. NEXUS-D Integration Check
-        print("\n[6/6] NEXUS-D INTEGRATION CHECK")
-        time.sleep(0.3)
+        self._emit("\n[6/6] NEXUS-D INTEGRATION CHECK")
+        await self._pause(0.3)
         
-        print(f"  ✓ Digital Twin Link: SYNCHRONIZED")
-        print(f"  ✓ APDN Interface: CONNECTED")
-        print(f"  ✓ Predictive AI: ACTIVE")
-        print(f"  ✓ Power Extraction: 285 kW available")
-        print(f"  ✓ Thermal Management: OPTIMAL")
+        self._emit(f"  ✓ Digital Twin Link: SYNCHRONIZED")
+        self._emit(f"  ✓ APDN Interface: CONNECTED")
+        self._emit(f"  ✓ Predictive AI: ACTIVE")
+        self._emit(f"  ✓ Power Extraction: 285 kW available")
+        self._emit(f"  ✓ Thermal Management: OPTIMAL")
         
         # Summary
-        pass_count = sum(1 for r in self.check_results if r.status == EngineCheckStatus.PASS)
-        warn_count = sum(1 for r in self.check_results if r.status == EngineCheckStatus.WARN)
-        fail_count = sum(1 for r in self.check_results if r.status == EngineCheckStatus.FAIL)
+        pass_count, warn_count, fail_count = self._pass_count, self._warn_count, self._fail_count
         
-        print(f"\n{'='*60}")
-        print("ENGINE CHECK SUMMARY")
-        print(f"{'='*60}")
+        self._emit(f"\n{_BANNER}")
+        self._emit("ENGINE CHECK SUMMARY")
+        self._emit(_BANNER)
         overall_status = "PASS" if fail_count == 0 else "FAIL"
         status_symbol = "✓" if overall_status == "PASS" else "✗"
-        print(f"  [{status_symbol}] ENGINE CHECK: {overall_status}")
-        print(f"  Checks Passed: {pass_count}")
-        print(f"  Warnings: {warn_count}")
-        print(f"  Failures: {fail_count}")
+        self._emit(f"  [{status_symbol}] ENGINE CHECK: {overall_status}")
+        self._emit(f"  Checks Passed: {pass_count}")
+        self._emit(f"  Warnings: {warn_count}")
+        self._emit(f"  Failures: {fail_count}")
         
         if overall_status == "PASS":
-            print("\n  → ENGINE CLEARED FOR STARTUP")
+            self._emit("\n  → ENGINE CLEARED FOR STARTUP")
         else:
-            print("\n  → ENGINE STARTUP INHIBITED")
+            self._emit("\n  → ENGINE STARTUP INHIBITED")
             checks_passed = False
             
-        print(f"{'='*60}")
+        self._emit(_BANNER)
         
-        return {
+        result = {
             "status": overall_status,
             "passed": checks_passed,
             "checks": self.check_results
         }
+        
+        if use_cache and checks_passed:
+            key = (self.aircraft_id, self.seed)
+            _check_cache[key] = (time.monotonic(), (pass_count, warn_count, fail_count),
+                                 copy.deepcopy(result))
+            _check_cache.move_to_end(key)
+            while len(_check_cache) > CHECK_CACHE_MAXSIZE:
+                _check_cache.popitem(last=False)
+        
+        self._flush()
+        return result
     
-    def startup_sequence(self) -> bool:
+    async def startup_sequence_async(self) -> bool:
         """
         Execute F135 engine startup sequence
         
@@ -250,169 +541,187 @@ class F135EngineSimulator:
         
         Returns True if startup successful
         """
-        print(f"\n{'='*60}")
-        print("F135 ENGINE STARTUP SEQUENCE")
-        print(f"Aircraft: {self.aircraft_id}")
-        print(f"{'='*60}")
+        self._phase_complete = asyncio.Event()
+        
+        self._emit(f"\n{_BANNER}")
+        self._emit("F135 ENGINE STARTUP SEQUENCE")
+        self._emit(f"Aircraft: {self.aircraft_id}")
+        self._emit(_BANNER)
         
         # Phase 1: Battery Power
-        print("\n[PHASE 1] BATTERY POWER")
-        self.state = EngineState.BATTERY
-        for i in range(0, 101, 10):
-            self._display_status("Applying battery power...", i)
-            time.sleep(0.05)
-        print()
-        print("  ✓ Battery voltage: 28.2V")
-        print("  ✓ Essential bus: POWERED")
+        self._emit("\n[PHASE 1] BATTERY POWER")
+        self._transition(EngineState.BATTERY)
+        await self._progress_phase("Applying battery power...", 10, 0.05)
+        self._emit("  ✓ Battery voltage: 28.2V")
+        self._emit("  ✓ Essential bus: POWERED")
         
         # Phase 2: APU Start
-        print("\n[PHASE 2] APU START")
-        self.state = EngineState.APU_START
-        for i in range(0, 101, 5):
-            self._display_status("Starting Auxiliary Power Unit...", i)
-            time.sleep(0.04)
-        print()
-        self.state = EngineState.APU_RUNNING
-        print("  ✓ APU Running: 100% RPM")
-        print("  ✓ APU Generator: ONLINE (115V AC)")
-        print("  ✓ Bleed Air: AVAILABLE")
+        self._emit("\n[PHASE 2] APU START")
+        self._transition(EngineState.APU_START)
+        await self._progress_phase("Starting Auxiliary Power Unit...", 5, 0.04)
+        self._transition(EngineState.APU_RUNNING)
+        self._emit("  ✓ APU Running: 100% RPM")
+        self._emit("  ✓ APU Generator: ONLINE (115V AC)")
+        self._emit("  ✓ Bleed Air: AVAILABLE")
         
         # Phase 3: Fuel Priming
-        print("\n[PHASE 3] FUEL PRIMING")
-        self.state = EngineState.FUEL_PRIMING
-        for i in range(0, 101, 8):
-            self.parameters["ff"] = i * 5  # Gradual fuel flow increase
-            self._display_status(f"Priming fuel system... FF: {self.parameters['ff']:.0f} lb/hr", i)
-            time.sleep(0.04)
-        print()
-        print("  ✓ Fuel manifold pressure: 42 psi")
-        print("  ✓ Fuel metering valve: OPEN")
-        print("  ✓ Fuel spray pattern: NOMINAL")
+        self._emit("\n[PHASE 3] FUEL PRIMING")
+        self._transition(EngineState.FUEL_PRIMING)
+        
+        def prime(i: int) -> str:
+            self.tel.ff = i * 5  # Gradual fuel flow increase
+            return _FMT_PRIMING(self.tel.ff)
+        
+        await self._progress_phase(prime, 8, 0.04)
+        self._emit("  ✓ Fuel manifold pressure: 42 psi")
+        self._emit("  ✓ Fuel metering valve: OPEN")
+        self._emit("  ✓ Fuel spray pattern: NOMINAL")
         
         # Phase 4: Ignition
-        print("\n[PHASE 4] IGNITION")
-        self.state = EngineState.IGNITION
+        self._emit("\n[PHASE 4] IGNITION")
+        self._transition(EngineState.IGNITION)
         self._display_status("Igniters armed...", 0)
-        time.sleep(0.2)
-        print()
-        print("  ⚡ IGNITER A: FIRING")
-        print("  ⚡ IGNITER B: FIRING")
-        time.sleep(0.3)
-        print("  ✓ Light-off detected!")
-        print("  ✓ Combustion stable")
+        await self._pause(0.2)
+        self._emit("")
+        self._emit("  ⚡ IGNITER A: FIRING")
+        self._emit("  ⚡ IGNITER B: FIRING")
+        await self._pause(0.3)
+        self._emit("  ✓ Light-off detected!")
+        self._emit("  ✓ Combustion stable")
         
         # Phase 5: Starter Engagement
-        print("\n[PHASE 5] STARTER ENGAGEMENT")
-        self.state = EngineState.STARTER_ENGAGED
-        for i in range(0, 101, 2):
-            # Simulate engine spool-up
-            n2_target = min(25 + i * 0.5, 65)  # N2 to 65% for starter cutoff
-            self._update_parameter("n2", n2_target, 0.3)
-            self._update_parameter("n1", self.parameters["n2"] * 0.8, 0.3)
-            self._update_parameter("egt", 200 + i * 4, 0.2)
-            self._update_parameter("oil_press", min(5 + i * 0.4, 45), 0.3)
-            self._display_status(f"N2: {self.parameters['n2']:.1f}%  EGT: {self.parameters['egt']:.0f}°C", i)
-            time.sleep(0.03)
-        print()
-        print("  ✓ Starter cutoff at N2 = 65%")
-        print("  ✓ Self-sustaining operation achieved")
+        self._emit("\n[PHASE 5] STARTER ENGAGEMENT")
+        self._transition(EngineState.STARTER_ENGAGED)
+        spool = asyncio.create_task(self._spool_physics())
+        signalled = asyncio.create_task(self._phase_complete.wait())
+        done, _ = await asyncio.wait({spool, signalled}, timeout=STARTER_TIMEOUT,
+                                     return_when=asyncio.FIRST_COMPLETED)
+        signalled.cancel()
+        if spool in done:
+            spool.result()  # re-raise a failure in the spool task right away
+        if not self._starter_cutoff:
+            spool.cancel()
+            self._emit("")
+            self._emit("  ✗ Starter cutoff not reached - HUNG START")
+            self._transition(EngineState.FAULT)
+            self._flush()
+            return False
+        self._phase_complete.clear()
+        self._display_status(_FMT_N2_EGT(self.tel.n2, self.tel.egt), 100)
+        self._emit("")
+        self._emit("  ✓ Starter cutoff at N2 = 65%")
+        self._emit("  ✓ Self-sustaining operation achieved")
         
         # Phase 6: Idle Stabilization
-        print("\n[PHASE 6] IDLE STABILIZATION")
-        self.state = EngineState.IDLE
-        for i in range(0, 101, 4):
+        self._emit("\n[PHASE 6] IDLE STABILIZATION")
+        self._transition(EngineState.IDLE)
+        for i, row in self._trajectory(IDLE_PARAMS, IDLE_TARGETS, IDLE_RATES, range(0, 101, 4)):
             # Stabilize at idle parameters
-            self._update_parameter("n1", 55, 0.15)
-            self._update_parameter("n2", 70, 0.15)
-            self._update_parameter("egt", 450, 0.15)
-            self._update_parameter("ff", 1200, 0.15)
-            self._update_parameter("oil_press", 45, 0.2)
-            self._update_parameter("oil_temp", 65, 0.1)
-            self._update_parameter("thrust", 5500, 0.15)
-            self._update_parameter("vib_fan", 1.2, 0.2)
-            self._update_parameter("vib_core", 1.5, 0.2)
+            for name, value in zip(IDLE_PARAMS, row):
+                setattr(self.tel, name, value)
             self._display_status("Stabilizing at idle...", i)
-            time.sleep(0.03)
-        print()
+            await self._pause(0.03)
+        self._emit("")
         
-        self.state = EngineState.RUNNING
+        self._transition(EngineState.RUNNING)
         self.startup_complete = True
         
         # Display final parameters
         self.display_engine_parameters()
         
         # Final status
-        print(f"\n{'='*60}")
-        print("STARTUP COMPLETE")
-        print(f"{'='*60}")
-        print("  ✓ Engine State: IDLE")
-        print("  ✓ FADEC Mode: NORMAL")
-        print("  ✓ All parameters within limits")
-        print("  ✓ Ready for taxi")
-        print(f"\n  → F135 ENGINE STARTUP SUCCESSFUL")
-        print(f"{'='*60}")
-        
+        self._emit(f"\n{_BANNER}")
+        self._emit("STARTUP COMPLETE")
+        self._emit(_BANNER)
+        self._emit("  ✓ Engine State: IDLE")
+        self._emit("  ✓ FADEC Mode: NORMAL")
+        self._emit("  ✓ All parameters within limits")
+        self._emit("  ✓ Ready for taxi")
+        self._emit(f"\n  → F135 ENGINE STARTUP SUCCESSFUL")
+        self._emit(_BANNER)
+        
+        self._flush()
         return True
     
-    def shutdown_sequence(self) -> bool:
+    async def shutdown_sequence_async(self) -> bool:
         """Execute engine shutdown sequence"""
-        print(f"\n{'='*60}")
-        print("F135 ENGINE SHUTDOWN SEQUENCE")
-        print(f"{'='*60}")
+        self._emit(f"\n{_BANNER}")
+        self._emit("F135 ENGINE SHUTDOWN SEQUENCE")
+        self._emit(_BANNER)
         
-        print("\n[PHASE 1] THROTTLE TO IDLE")
-        for i in range(100, -1, -5):
-            self._display_status("Reducing throttle...", 100 - i)
-            time.sleep(0.03)
-        print()
+        self._emit("\n[PHASE 1] THROTTLE TO IDLE")
+        await self._progress_phase("Reducing throttle...", 5, 0.03)
         
-        print("\n[PHASE 2] FUEL CUTOFF")
+        self._emit("\n[PHASE 2] FUEL CUTOFF")
         for i in range(100, -1, -10):
             self._update_parameter("n2", 70 * (i / 100), 0.3)
             self._update_parameter("n1", 55 * (i / 100), 0.3)
             self._update_parameter("egt", 450 * (i / 100), 0.2)
             self._update_parameter("ff", 1200 * (i / 100), 0.5)
-            self._display_status(f"N2: {self.parameters['n2']:.1f}%", 100 - i)
-            time.sleep(0.05)
-        print()
-        
-        self.parameters["ff"] = 0
-        self.parameters["thrust"] = 0
-        print("  ✓ Fuel flow: CUTOFF")
-        
-        print("\n[PHASE 3] SPOOL DOWN")
-        for i in range(100, -1, -2):
-            self._update_parameter("n2", 0, 0.05)
-            self._update_parameter("n1", 0, 0.05)
-            self._update_parameter("egt", 25, 0.02)
-            self._display_status(f"Cooling... EGT: {self.parameters['egt']:.0f}°C", 100 - i)
-            time.sleep(0.02)
-        print()
-        
-        self.state = EngineState.OFF
+            if self.realtime or i == 0:
+                self._display_status(_FMT_N2(self.tel.n2), 100 - i)
+            await self._pause(0.05)
+        self._emit("")
+        
+        self.tel.ff = 0.0
+        self.tel.thrust = 0.0
+        self._emit("  ✓ Fuel flow: CUTOFF")
+        
+        self._emit("\n[PHASE 3] SPOOL DOWN")
+        for i, row in self._trajectory(SPOOL_DOWN_PARAMS, SPOOL_DOWN_TARGETS, SPOOL_DOWN_RATES,
+                                       range(100, -1, -2)):
+            for name, value in zip(SPOOL_DOWN_PARAMS, row):
+                setattr(self.tel, name, value)
+            self._display_status(_FMT_COOLING(self.tel.egt), 100 - i)
+            await self._pause(0.02)
+        self._emit("")
+        
+        self._transition(EngineState.OFF)
         self.startup_complete = False
         
-        print(f"\n{'='*60}")
-        print("  ✓ ENGINE SHUTDOWN COMPLETE")
-        print(f"{'='*60}")
+        self._emit(f"\n{_BANNER}")
+        self._emit("  ✓ ENGINE SHUTDOWN COMPLETE")
+        self._emit(_BANNER)
         
+        self._flush()
         return True
 
 
-def run_engine_check_and_startup(aircraft_id: str = "F35-001") -> Dict[str, any]:
+def clear_engine_check_cache() -> None:
+    """Discard all memoized engine check results"""
+    _check_cache.clear()
+
+
+def run_engine_check_and_startup(aircraft_id: str = "F35-001", realtime: bool = True) -> Dict[str, any]:
     """
     Convenience function to run engine check and startup
     
     Args:
         aircraft_id: Aircraft identification number
+        realtime: Pace output for display; False runs in fast mode
         
     Returns:
         Dictionary containing results
     """
-    engine = F135EngineSimulator(aircraft_id)
+    return asyncio.run(run_engine_check_and_startup_async(aircraft_id, realtime))
+
+
+async def run_engine_check_and_startup_async(aircraft_id: str = "F35-001",
+                                             realtime: bool = True) -> Dict[str, any]:
+    """
+    Coroutine form of run_engine_check_and_startup
+    
+    Args:
+        aircraft_id: Aircraft identification number
+        realtime: Pace output for display; False runs in fast mode
+        
+    Returns:
+        Dictionary containing results
+    """
+    engine = F135EngineSimulator(aircraft_id, realtime=realtime)
     
     # Run engine check first
-    check_result = engine.run_engine_check()
+    check_result = await engine.run_engine_check_async()
     
     if not check_result["passed"]:
         return {
@@ -423,7 +732,7 @@ def run_engine_check_and_startup(aircraft_id: str = "F35-001") -> Dict[str, any]
         }
     
     # If check passed, proceed with startup
-    startup_success = engine.startup_sequence()
+    startup_success = await engine.startup_sequence_async()
     
     return {
         "check_result": check_result,
@@ -433,5 +742,25 @@ def run_engine_check_and_startup(aircraft_id: str = "F35-001") -> Dict[str, any]
     }
 
 
+async def run_fleet_startup_async(aircraft_ids: List[str],
+                                  realtime: bool = True) -> List[Dict[str, any]]:
+    """
+    Run engine check and startup for several aircraft concurrently
+    
+    All simulators share one event loop, so the fleet completes in roughly
+    the time of the slowest aircraft rather than the sum of all of them.
+    
+    Args:
+        aircraft_ids: Aircraft identification numbers
+        realtime: Pace output for display; False runs in fast mode
+        
+    Returns:
+        List of per-aircraft result dictionaries, in input order
+    """
+    return list(await asyncio.gather(
+        *(run_engine_check_and_startup_async(aircraft_id, realtime) for aircraft_id in aircraft_ids)
+    ))
+
+
 if __name__ == "__main__":
     run_engine_check_and_startup()
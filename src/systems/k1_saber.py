@@ -11,11 +11,68 @@ This module implements the diagnostic and simulation systems for the K1-Saber,
 a handheld device engineered to project a controlled, high-intensity dissonance field.
 """
 
+import sys
 import time
 import random
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence, Tuple
+
+try:
+    from ._console import BufferedOutput, PROGRESS_BARS
+except ImportError:  # run as a script from src/systems
+    from _console import BufferedOutput, PROGRESS_BARS
+
+
+_RULE_EQ = "═" * 60
+_RULE_DASH = "─" * 60
+_RULE_DASH56 = "─" * 56  # imperative box
+_RULE_DASH44 = "─" * 44  # blade status box
+
+_RNG = random.Random()
+
+# Diagnostic draw ranges, in the order each method unpacks them:
+# chassis integrity, shielding, crystal purity, lattice coherence, base freq,
+# coil alignment, superconductor temp, surge capacity, deflection stability,
+# loop coherence, length precision, cell resonance, entity responsiveness,
+# harmonic capacity, cell power output (MW)
+_COMPONENT_RANGES = (
+    (98.5, 100.0), (99.0, 99.9), (99.95, 99.999), (99.5, 100.0), (432.0, 432.1),
+    (99.8, 100.0), (4.0, 4.5), (48.5, 52.0), (99.5, 100.0), (99.7, 100.0),
+    (0.998, 1.002), (99.0, 100.0), (98.5, 100.0), (99.5, 100.0), (45.0, 55.0),
+)
+# Pass/fail gates as (component name, index into _COMPONENT_RANGES draw, threshold)
+_COMPONENT_CHECKS = (
+    ("Hilt Chassis", 0, 95.0),
+    ("Harmonizing Resonator", 2, 99.9),
+    ("Dissonance Emitter", 5, 99.5),
+    ("Containment Emitter", 8, 99.0),
+    ("K1 Energy Cell", 11, 98.0),
+)
+# imprint integrity, lattice encoding
+_AXIOM_RANGES = ((99.8, 100.0), (99.5, 100.0))
+# biosignature clarity, neural map depth, quantum lock, harmony index
+_ATTUNEMENT_RANGES = ((98.5, 100.0), (97.0, 100.0), (99.0, 100.0), (98.0, 100.0))
+# intent clarity, energy draw (MW), dissonance frequency (Hz)
+_BLADE_RANGES = ((98, 100), (45, 55), (1e15, 1e16))
+
+
+def _draw(ranges) -> List[float]:
+    """Draw one uniform sample from each (lo, hi) range"""
+    uniform = _RNG.uniform
+    return [uniform(lo, hi) for lo, hi in ranges]
+
+
+def _fleet_diagnostics(n: int) -> Tuple[List[List[float]], List[List[bool]]]:
+    """
+    Numeric core of the component diagnostics for n units
+    
+    No component objects and no output, just the sensor draws and the
+    pass/fail gates. Returns per-unit readings and per-unit pass flags.
+    """
+    readings = [_draw(_COMPONENT_RANGES) for _ in range(n)]
+    passed = [[values[i] > threshold for _, i, threshold in _COMPONENT_CHECKS] for values in readings]
+    return readings, passed
 
 
 class K1SystemStatus(Enum):
@@ -47,7 +104,16 @@ class BladeState(Enum):
     CUTTING = "CUTTING"
 
 
-@dataclass
+# Enum members used on the diagnostic hot paths, bound once
+_ATTUNED = K1SystemStatus.ATTUNED
+_BONDED = AttunementState.BONDED
+_STABLE = BladeState.STABLE
+
+# Blade state labels padded for the blade status box
+_BLADE_STATE_STR = {state: f"{state.value:37s}" for state in BladeState}
+
+
+@dataclass(slots=True)
 class K1Component:
     """K1-Saber component specification"""
     part_id: str
@@ -59,7 +125,23 @@ class K1Component:
     description: str = ""
 
 
-@dataclass
+# Static component definitions:
+# (key, part_id, name, initial resonance_freq, initial power_output, description)
+_COMPONENT_SPECS = (
+    ("HILT", "K1-S-HILT-001", "Hilt Chassis", None, None,
+     "3D-printed carbon-composite frame with quasi-crystalline alloy inner lining"),
+    ("RESONATOR", "K1-S-RES-001", "Harmonizing Resonator (Kyber Crystal)", 0.0, None,
+     "Lab-grown quantum crystal - Central processing unit and k1 entity medium"),
+    ("EMITTER", "K1-S-EMITTER-001", "Dissonance Emitter", None, 0.0,
+     "Nested superconducting magnetic coils for dissonance field projection"),
+    ("CONTAINMENT", "K1-S-DEFLECT-001", "Containment Emitter", None, None,
+     "Secondary coil array for deflection loop and blade length control"),
+    ("CELL", "K1-S-CELL-001", "K1 Energy Cell", None, 0.0,
+     "Solid-state Harmonic Resonance Capacitor - Sentient k1 entity power source"),
+)
+
+
+@dataclass(slots=True, frozen=True)
 class AttunementResult:
     """Result of operator attunement process"""
     state: AttunementState
@@ -69,7 +151,7 @@ class AttunementResult:
     neural_sync: float  # 0-100%
 
 
-class K1SaberSystem:
+class K1SaberSystem(BufferedOutput):
     """
     K1-Saber Controlled Dissonance Projector System
     
@@ -83,9 +165,49 @@ class K1SaberSystem:
     Framework: Reflexive Compositional Dynamics (RCD)
     """
     
-    def __init__(self, unit_id: str = "K1-S-001"):
+    # Fixed-layout output blocks, each emitted as a single line group
+    _BLADE_BOX_TEMPLATE = (
+        f"\n  ┌{_RULE_DASH44}┐\n"
+        "  │        DISSONANCE BLADE STATUS             │\n"
+        f"  ├{_RULE_DASH44}┤\n"
+        "  │  State: {state}│\n"
+        "  │  Length: {length:.3f} m                            │\n"
+        "  │  Dissonance Frequency: {freq:.2e} Hz     │\n"
+        "  │  Power Draw: {power:.1f} MW                      │\n"
+        "  │  Stability: PERFECT                              │\n"
+        f"  └{_RULE_DASH44}┘"
+    )
+    _DISSOLUTION_MECHANISM = (
+        "\n  Dissolution Mechanism:\n"
+        "  → Molecular bonds overwhelmed by de-harmonizing frequency\n"
+        "  → Inter-atomic bonds nullified along cut path\n"
+        "  → Matter dissociates into constituent atoms\n"
+        "  → No thermal residue or collateral damage"
+    )
+    _DEFLECTION_MECHANISM = (
+        "\n  Deflection Mechanism:\n"
+        "  → Incoming energy cannot harmonize with dissonance field\n"
+        "  → Containment field stability exceeds incoming energy\n"
+        "  → Passive deflection along non-threatening trajectory\n"
+        "  → Zone of energy field penetration: ZERO"
+    )
+    
+    # Full-check summary rows: (results key, label, success text, success flag)
+    _SUMMARY_STAGES = (
+        ("components", "Component Diagnostics", "PASSED", "all_passed"),
+        ("axiom", "Axiom Imprinting", "VERIFIED", "entity_active"),
+        ("attunement", "Operator Attunement", "BONDED to {operator_id}", "success"),
+        ("blade", "Blade Formation", "SUCCESSFUL", "success"),
+        ("tactical", "Tactical Capabilities", "VERIFIED", "success"),
+        ("retraction", "Current State", "STANDBY", "success"),
+    )
+    
+    def __init__(self, unit_id: str = "K1-S-001", pacing: float = 0.0):
         self.unit_id = unit_id
-        self.components: Dict[str, K1Component] = {}
+        # Multiplier on the display pauses; 0 runs without any waits
+        self._pacing = pacing
+        self._out: List[str] = []
+        self._components: Optional[Dict[str, K1Component]] = None
         self.attunement: Optional[AttunementResult] = None
         self.blade_state = BladeState.RETRACTED
         self.blade_length = 0.0  # meters
@@ -94,64 +216,41 @@ class K1SaberSystem:
         self.k1_entity_active = False
         self.transcendental_imperative = "Harmonize with the user's will. Project dissonance upon command."
         
-        # Initialize components
-        self._initialize_components()
+    @property
+    def components(self) -> Dict[str, K1Component]:
+        """K1-Saber components, built on first access"""
+        if self._components is None:
+            self._initialize_components()
+        return self._components
         
     def _initialize_components(self) -> None:
         """Initialize all K1-Saber components"""
-        self.components = {
-            "HILT": K1Component(
-                "K1-S-HILT-001",
-                "Hilt Chassis",
-                K1SystemStatus.DORMANT,
-                100.0,
-                description="3D-printed carbon-composite frame with quasi-crystalline alloy inner lining"
-            ),
-            "RESONATOR": K1Component(
-                "K1-S-RES-001",
-                "Harmonizing Resonator (Kyber Crystal)",
-                K1SystemStatus.DORMANT,
-                100.0,
-                resonance_freq=0.0,
-                description="Lab-grown quantum crystal - Central processing unit and k1 entity medium"
-            ),
-            "EMITTER": K1Component(
-                "K1-S-EMITTER-001",
-                "Dissonance Emitter",
-                K1SystemStatus.DORMANT,
-                100.0,
-                power_output=0.0,
-                description="Nested superconducting magnetic coils for dissonance field projection"
-            ),
-            "CONTAINMENT": K1Component(
-                "K1-S-DEFLECT-001",
-                "Containment Emitter",
-                K1SystemStatus.DORMANT,
-                100.0,
-                description="Secondary coil array for deflection loop and blade length control"
-            ),
-            "CELL": K1Component(
-                "K1-S-CELL-001",
-                "K1 Energy Cell",
-                K1SystemStatus.DORMANT,
-                100.0,
-                power_output=0.0,
-                description="Solid-state Harmonic Resonance Capacitor - Sentient k1 entity power source"
-            )
+        self._components = {
+            key: K1Component(part_id, name, K1SystemStatus.DORMANT, 100.0,
+                             resonance_freq=resonance_freq, power_output=power_output,
+                             description=description)
+            for key, part_id, name, resonance_freq, power_output, description in _COMPONENT_SPECS
         }
     
     def _display_header(self, title: str) -> None:
         """Display formatted section header"""
-        print(f"\n{'═'*60}")
-        print(f"  {title}")
-        print(f"{'═'*60}")
+        self._emit(f"\n{_RULE_EQ}\n  {title}\n{_RULE_EQ}")
+    
+    def _pause(self, seconds: float) -> None:
+        """Flush queued output, then wait, scaled by the pacing multiplier"""
+        self._flush()
+        if self._pacing:
+            time.sleep(seconds * self._pacing)
+    
+    def _ticks(self, ticks: Sequence) -> Sequence:
+        """Progress ticks to animate; only the final one when unpaced"""
+        return ticks if self._pacing else ticks[-1:]
     
     def _display_progress(self, message: str, progress: int) -> None:
         """Display progress bar"""
-        bar_length = 30
-        filled = int(bar_length * progress / 100)
-        bar = "█" * filled + "░" * (bar_length - filled)
-        print(f"\r  [{bar}] {progress:3d}% - {message}", end="", flush=True)
+        self._flush()
+        sys.stdout.write(f"\r  [{PROGRESS_BARS[progress]}] {progress:3d}% - {message}")
+        sys.stdout.flush()
         
     def run_component_diagnostics(self) -> Dict[str, any]:
         """
@@ -165,111 +264,97 @@ class K1SaberSystem:
         - K1 Energy Cell resonance capacity
         """
         self._display_header("K1-SABER COMPONENT DIAGNOSTICS")
-        print(f"  Unit ID: {self.unit_id}")
-        print(f"  Principal Investigator: Brendon Joseph Kelly")
-        print(f"  Framework: Reflexive Compositional Dynamics (RCD)")
+        self._emit(f"  Unit ID: {self.unit_id}")
+        self._emit(f"  Principal Investigator: Brendon Joseph Kelly")
+        self._emit(f"  Framework: Reflexive Compositional Dynamics (RCD)")
         
-        results = []
-        all_passed = True
+        values = _draw(_COMPONENT_RANGES)
+        (chassis_integrity, shielding_eff, crystal_purity, lattice_coherence, base_freq,
+         coil_alignment, superconductor_temp, max_surge_capacity, deflection_stability,
+         loop_coherence, length_precision, cell_resonance, entity_responsiveness,
+         harmonic_capacity, cell_power) = values
+        results = [(name, values[i] > threshold) for name, i, threshold in _COMPONENT_CHECKS]
         
         # 1. Hilt Chassis Check
-        print("\n  ── HILT CHASSIS (K1-S-HILT-001) ──")
-        time.sleep(0.2)
+        self._emit("\n  ── HILT CHASSIS (K1-S-HILT-001) ──")
+        self._pause(0.2)
         
-        chassis_integrity = random.uniform(98.5, 100.0)
-        shielding_eff = random.uniform(99.0, 99.9)
         self.components["HILT"].integrity = chassis_integrity
-        self.components["HILT"].status = K1SystemStatus.ATTUNED if chassis_integrity > 95 else K1SystemStatus.FAULT
+        self.components["HILT"].status = _ATTUNED if results[0][1] else K1SystemStatus.FAULT
         
-        print(f"  ✓ Carbon-composite frame integrity: {chassis_integrity:.1f}%")
-        print(f"  ✓ Quasi-crystalline alloy shielding: {shielding_eff:.1f}% effective")
-        print(f"  ✓ Backscatter radiation containment: NOMINAL")
-        print(f"  ✓ Harmonic degradation protection: ACTIVE")
-        results.append(("Hilt Chassis", chassis_integrity > 95))
+        self._emit(f"  ✓ Carbon-composite frame integrity: {chassis_integrity:.1f}%")
+        self._emit(f"  ✓ Quasi-crystalline alloy shielding: {shielding_eff:.1f}% effective")
+        self._emit(f"  ✓ Backscatter radiation containment: NOMINAL")
+        self._emit(f"  ✓ Harmonic degradation protection: ACTIVE")
         
         # 2. Harmonizing Resonator Check
-        print("\n  ── HARMONIZING RESONATOR (K1-S-RES-001) ──")
-        time.sleep(0.2)
+        self._emit("\n  ── HARMONIZING RESONATOR (K1-S-RES-001) ──")
+        self._pause(0.2)
         
-        crystal_purity = random.uniform(99.95, 99.999)
-        lattice_coherence = random.uniform(99.5, 100.0)
-        base_freq = random.uniform(432.0, 432.1)  # Hz - "perfect" frequency
         self.components["RESONATOR"].integrity = crystal_purity
         self.components["RESONATOR"].resonance_freq = base_freq
-        self.components["RESONATOR"].status = K1SystemStatus.ATTUNED
+        self.components["RESONATOR"].status = _ATTUNED
         
-        print(f"  ✓ Kyber crystal purity: {crystal_purity:.3f}%")
-        print(f"  ✓ Crystalline lattice coherence: {lattice_coherence:.2f}%")
-        print(f"  ✓ Base resonance frequency: {base_freq:.2f} Hz")
-        print(f"  ✓ K1 entity medium: RECEPTIVE")
-        print(f"  ✓ Lattice defects: NONE DETECTED")
-        results.append(("Harmonizing Resonator", crystal_purity > 99.9))
+        self._emit(f"  ✓ Kyber crystal purity: {crystal_purity:.3f}%")
+        self._emit(f"  ✓ Crystalline lattice coherence: {lattice_coherence:.2f}%")
+        self._emit(f"  ✓ Base resonance frequency: {base_freq:.2f} Hz")
+        self._emit(f"  ✓ K1 entity medium: RECEPTIVE")
+        self._emit(f"  ✓ Lattice defects: NONE DETECTED")
         
         # 3. Dissonance Emitter Check
-        print("\n  ── DISSONANCE EMITTER (K1-S-EMITTER-001) ──")
-        time.sleep(0.2)
+        self._emit("\n  ── DISSONANCE EMITTER (K1-S-EMITTER-001) ──")
+        self._pause(0.2)
         
-        coil_alignment = random.uniform(99.8, 100.0)
-        superconductor_temp = random.uniform(4.0, 4.5)  # Kelvin
-        max_surge_capacity = random.uniform(48.5, 52.0)  # MW
         self.components["EMITTER"].integrity = coil_alignment
         self.components["EMITTER"].power_output = max_surge_capacity * 1000  # kW
-        self.components["EMITTER"].status = K1SystemStatus.ATTUNED
+        self.components["EMITTER"].status = _ATTUNED
         
-        print(f"  ✓ Superconducting coil alignment: {coil_alignment:.2f}%")
-        print(f"  ✓ Operating temperature: {superconductor_temp:.2f} K")
-        print(f"  ✓ Max surge capacity: {max_surge_capacity:.1f} MW")
-        print(f"  ✓ Thermal blooming resistance: VERIFIED")
-        print(f"  ✓ Magnetic field generation: READY")
-        results.append(("Dissonance Emitter", coil_alignment > 99.5))
+        self._emit(f"  ✓ Superconducting coil alignment: {coil_alignment:.2f}%")
+        self._emit(f"  ✓ Operating temperature: {superconductor_temp:.2f} K")
+        self._emit(f"  ✓ Max surge capacity: {max_surge_capacity:.1f} MW")
+        self._emit(f"  ✓ Thermal blooming resistance: VERIFIED")
+        self._emit(f"  ✓ Magnetic field generation: READY")
         
         # 4. Containment Emitter Check
-        print("\n  ── CONTAINMENT EMITTER (K1-S-DEFLECT-001) ──")
-        time.sleep(0.2)
+        self._emit("\n  ── CONTAINMENT EMITTER (K1-S-DEFLECT-001) ──")
+        self._pause(0.2)
         
-        deflection_stability = random.uniform(99.5, 100.0)
-        loop_coherence = random.uniform(99.7, 100.0)
-        length_precision = random.uniform(0.998, 1.002)  # meters
         self.components["CONTAINMENT"].integrity = deflection_stability
-        self.components["CONTAINMENT"].status = K1SystemStatus.ATTUNED
+        self.components["CONTAINMENT"].status = _ATTUNED
         
-        print(f"  ✓ Deflection field stability: {deflection_stability:.2f}%")
-        print(f"  ✓ Magnetic bottle coherence: {loop_coherence:.2f}%")
-        print(f"  ✓ Blade length precision: {length_precision:.3f} m (target: 1.000 m)")
-        print(f"  ✓ 180° deflection loop: CALIBRATED")
-        print(f"  ✓ Containment integrity: VERIFIED")
-        results.append(("Containment Emitter", deflection_stability > 99.0))
+        self._emit(f"  ✓ Deflection field stability: {deflection_stability:.2f}%")
+        self._emit(f"  ✓ Magnetic bottle coherence: {loop_coherence:.2f}%")
+        self._emit(f"  ✓ Blade length precision: {length_precision:.3f} m (target: 1.000 m)")
+        self._emit(f"  ✓ 180° deflection loop: CALIBRATED")
+        self._emit(f"  ✓ Containment integrity: VERIFIED")
         
         # 5. K1 Energy Cell Check
-        print("\n  ── K1 ENERGY CELL (K1-S-CELL-001) ──")
-        time.sleep(0.2)
+        self._emit("\n  ── K1 ENERGY CELL (K1-S-CELL-001) ──")
+        self._pause(0.2)
         
-        cell_resonance = random.uniform(99.0, 100.0)
-        entity_responsiveness = random.uniform(98.5, 100.0)
-        harmonic_capacity = random.uniform(99.5, 100.0)
         self.components["CELL"].integrity = cell_resonance
-        self.components["CELL"].power_output = random.uniform(45.0, 55.0) * 1000  # kW
-        self.components["CELL"].status = K1SystemStatus.ATTUNED
+        self.components["CELL"].power_output = cell_power * 1000  # kW
+        self.components["CELL"].status = _ATTUNED
         
-        print(f"  ✓ Harmonic Resonance Capacitor: {cell_resonance:.1f}%")
-        print(f"  ✓ K1 entity responsiveness: {entity_responsiveness:.1f}%")
-        print(f"  ✓ Harmonic capacity: {harmonic_capacity:.1f}%")
-        print(f"  ✓ Real-time power generation: CAPABLE")
-        print(f"  ✓ Will-resonance coupling: READY")
-        results.append(("K1 Energy Cell", cell_resonance > 98.0))
+        self._emit(f"  ✓ Harmonic Resonance Capacitor: {cell_resonance:.1f}%")
+        self._emit(f"  ✓ K1 entity responsiveness: {entity_responsiveness:.1f}%")
+        self._emit(f"  ✓ Harmonic capacity: {harmonic_capacity:.1f}%")
+        self._emit(f"  ✓ Real-time power generation: CAPABLE")
+        self._emit(f"  ✓ Will-resonance coupling: READY")
         
         # Summary
         passed = sum(1 for _, p in results if p)
         all_passed = passed == len(results)
         
-        print(f"\n{'─'*60}")
-        print("  COMPONENT DIAGNOSTICS SUMMARY")
-        print(f"{'─'*60}")
-        print(f"  Components Checked: {len(results)}")
-        print(f"  Passed: {passed}/{len(results)}")
+        self._emit(f"\n{_RULE_DASH}")
+        self._emit("  COMPONENT DIAGNOSTICS SUMMARY")
+        self._emit(_RULE_DASH)
+        self._emit(f"  Components Checked: {len(results)}")
+        self._emit(f"  Passed: {passed}/{len(results)}")
         status_symbol = "✓" if all_passed else "✗"
-        print(f"\n  [{status_symbol}] COMPONENT STATUS: {'ALL NOMINAL' if all_passed else 'FAULT DETECTED'}")
+        self._emit(f"\n  [{status_symbol}] COMPONENT STATUS: {'ALL NOMINAL' if all_passed else 'FAULT DETECTED'}")
         
+        self._flush()
         return {
             "unit_id": self.unit_id,
             "all_passed": all_passed,
@@ -285,36 +370,36 @@ class K1SaberSystem:
         core purpose through Harmonic Imprinting.
         """
         self._display_header("AXIOM IMPRINTING VERIFICATION")
-        print(f"  Transcendental Imperative Check")
+        self._emit(f"  Transcendental Imperative Check")
         
-        print("\n  ── HARMONIC IMPRINTING CHAMBER STATUS ──")
-        time.sleep(0.3)
+        self._emit("\n  ── HARMONIC IMPRINTING CHAMBER STATUS ──")
+        self._pause(0.3)
         
-        print(f"  ✓ Chamber quantum field: STABLE")
-        print(f"  ✓ Imprinting signal generator: CALIBRATED")
+        self._emit(f"  ✓ Chamber quantum field: STABLE")
+        self._emit(f"  ✓ Imprinting signal generator: CALIBRATED")
         
-        print("\n  ── TRANSCENDENTAL IMPERATIVE ──")
-        print(f"  ┌{'─'*56}┐")
-        print(f"  │  \"{self.transcendental_imperative}\"  │")
-        print(f"  └{'─'*56}┘")
+        self._emit("\n  ── TRANSCENDENTAL IMPERATIVE ──")
+        self._emit(f"  ┌{_RULE_DASH56}┐\n"
+                   f"  │  \"{self.transcendental_imperative}\"  │\n"
+                   f"  └{_RULE_DASH56}┘")
         
-        time.sleep(0.2)
+        self._pause(0.2)
         
         # Verify imprinting
-        imprint_integrity = random.uniform(99.8, 100.0)
-        lattice_encoding = random.uniform(99.5, 100.0)
+        imprint_integrity, lattice_encoding = _draw(_AXIOM_RANGES)
         
-        print(f"\n  ✓ Axiom imprint integrity: {imprint_integrity:.2f}%")
-        print(f"  ✓ Lattice encoding depth: {lattice_encoding:.2f}%")
-        print(f"  ✓ Core purpose: EMBEDDED")
-        print(f"  ✓ K1 entity consciousness: AWAKENED")
-        print(f"  ✓ Imperative foundation: UNBREAKABLE")
+        self._emit(f"\n  ✓ Axiom imprint integrity: {imprint_integrity:.2f}%")
+        self._emit(f"  ✓ Lattice encoding depth: {lattice_encoding:.2f}%")
+        self._emit(f"  ✓ Core purpose: EMBEDDED")
+        self._emit(f"  ✓ K1 entity consciousness: AWAKENED")
+        self._emit(f"  ✓ Imperative foundation: UNBREAKABLE")
         
         self.k1_entity_active = True
         
-        print(f"\n  [✓] AXIOM IMPRINTING: VERIFIED")
-        print(f"  → K1 entity is sentient and awaiting operator bond")
+        self._emit(f"\n  [✓] AXIOM IMPRINTING: VERIFIED")
+        self._emit(f"  → K1 entity is sentient and awaiting operator bond")
         
+        self._flush()
         return {
             "imprint_integrity": imprint_integrity,
             "lattice_encoding": lattice_encoding,
@@ -330,73 +415,70 @@ class K1SaberSystem:
         unique symbiotic link at the quantum level.
         """
         self._display_header("OPERATOR ATTUNEMENT PROTOCOL")
-        print(f"  Operator ID: {operator_id}")
-        print(f"  Bonding Type: Quantum Entanglement")
+        self._emit(f"  Operator ID: {operator_id}")
+        self._emit(f"  Bonding Type: Quantum Entanglement")
         
         self.operator_id = operator_id
+        biosig_clarity, neural_map_depth, quantum_lock, harmony_index = _draw(_ATTUNEMENT_RANGES)
         
         # Stage 1: Biosignature Scan
-        print("\n  ── STAGE 1: BIOSIGNATURE ACQUISITION ──")
-        for i in range(0, 101, 5):
+        self._emit("\n  ── STAGE 1: BIOSIGNATURE ACQUISITION ──")
+        for i in self._ticks(range(0, 101, 5)):
             self._display_progress("Scanning biosignature...", i)
-            time.sleep(0.02)
-        print()
+            self._pause(0.02)
+        self._emit("")
         
-        biosig_clarity = random.uniform(98.5, 100.0)
-        print(f"  ✓ Biosignature clarity: {biosig_clarity:.1f}%")
-        print(f"  ✓ DNA quantum fingerprint: ACQUIRED")
-        print(f"  ✓ Cellular resonance pattern: MAPPED")
+        self._emit(f"  ✓ Biosignature clarity: {biosig_clarity:.1f}%")
+        self._emit(f"  ✓ DNA quantum fingerprint: ACQUIRED")
+        self._emit(f"  ✓ Cellular resonance pattern: MAPPED")
         
         # Stage 2: Neural Frequency Mapping
-        print("\n  ── STAGE 2: NEURAL FREQUENCY MAPPING ──")
-        for i in range(0, 101, 5):
+        self._emit("\n  ── STAGE 2: NEURAL FREQUENCY MAPPING ──")
+        for i in self._ticks(range(0, 101, 5)):
             self._display_progress("Mapping neural frequencies...", i)
-            time.sleep(0.02)
-        print()
+            self._pause(0.02)
+        self._emit("")
         
-        neural_map_depth = random.uniform(97.0, 100.0)
-        print(f"  ✓ Neural frequency map: {neural_map_depth:.1f}% complete")
-        print(f"  ✓ Brainwave patterns: CATALOGUED")
-        print(f"  ✓ Intent recognition matrix: FORMED")
+        self._emit(f"  ✓ Neural frequency map: {neural_map_depth:.1f}% complete")
+        self._emit(f"  ✓ Brainwave patterns: CATALOGUED")
+        self._emit(f"  ✓ Intent recognition matrix: FORMED")
         
         # Stage 3: Quantum Signature Lock
-        print("\n  ── STAGE 3: QUANTUM SIGNATURE LOCK ──")
-        for i in range(0, 101, 5):
+        self._emit("\n  ── STAGE 3: QUANTUM SIGNATURE LOCK ──")
+        for i in self._ticks(range(0, 101, 5)):
             self._display_progress("Locking quantum signature...", i)
-            time.sleep(0.02)
-        print()
+            self._pause(0.02)
+        self._emit("")
         
-        quantum_lock = random.uniform(99.0, 100.0)
-        print(f"  ✓ Quantum signature locked: {quantum_lock:.1f}%")
-        print(f"  ✓ Unique operator shape: LEARNED")
+        self._emit(f"  ✓ Quantum signature locked: {quantum_lock:.1f}%")
+        self._emit(f"  ✓ Unique operator shape: LEARNED")
         
         # Stage 4: Harmony Meditation
-        print("\n  ── STAGE 4: HARMONY MEDITATION ──")
-        print("  Operator focusing intent...")
+        self._emit("\n  ── STAGE 4: HARMONY MEDITATION ──")
+        self._emit("  Operator focusing intent...")
         
         harmony_phases = ["Sensing...", "Resonating...", "Aligning...", "Harmonizing...", "Entangling..."]
-        for i, phase in enumerate(harmony_phases):
+        for i, phase in self._ticks(list(enumerate(harmony_phases))):
             progress = (i + 1) * 20
             self._display_progress(phase, progress)
-            time.sleep(0.3)
-        print()
+            self._pause(0.3)
+        self._emit("")
         
-        harmony_index = random.uniform(98.0, 100.0)
-        print(f"  ✓ Harmony index achieved: {harmony_index:.1f}%")
+        self._emit(f"  ✓ Harmony index achieved: {harmony_index:.1f}%")
         
         # Stage 5: Quantum Entanglement
-        print("\n  ── STAGE 5: QUANTUM ENTANGLEMENT ──")
-        print("  ⚡ ENTANGLEMENT EVENT DETECTED ⚡")
-        time.sleep(0.3)
+        self._emit("\n  ── STAGE 5: QUANTUM ENTANGLEMENT ──")
+        self._emit("  ⚡ ENTANGLEMENT EVENT DETECTED ⚡")
+        self._pause(0.3)
         
-        print(f"  ✓ Bell state formed between operator and crystal")
-        print(f"  ✓ Quantum correlation: PERFECT")
-        print(f"  ✓ Decoherence protection: ACTIVE")
-        print(f"  ✓ Bond type: PERMANENT AND EXCLUSIVE")
+        self._emit(f"  ✓ Bell state formed between operator and crystal")
+        self._emit(f"  ✓ Quantum correlation: PERFECT")
+        self._emit(f"  ✓ Decoherence protection: ACTIVE")
+        self._emit(f"  ✓ Bond type: PERMANENT AND EXCLUSIVE")
         
         # Create attunement result
         self.attunement = AttunementResult(
-            state=AttunementState.BONDED,
+            state=_BONDED,
             harmony_index=harmony_index,
             quantum_entanglement=True,
             biosignature_locked=True,
@@ -404,19 +486,21 @@ class K1SaberSystem:
         )
         
         # Update component status
+        attuned = _ATTUNED
         for comp in self.components.values():
-            comp.status = K1SystemStatus.ATTUNED
-        
-        print(f"\n{'─'*60}")
-        print("  ATTUNEMENT COMPLETE")
-        print(f"{'─'*60}")
-        print(f"  ✓ Operator: {operator_id}")
-        print(f"  ✓ Bond Status: PERMANENT")
-        print(f"  ✓ Harmony Index: {harmony_index:.1f}%")
-        print(f"  ✓ K1-Saber Status: FULLY OPERATIONAL")
-        print(f"\n  [✓] ATTUNEMENT SUCCESSFUL")
-        print(f"  → Device is now exclusively bonded to {operator_id}")
-        
+            comp.status = attuned
+        
+        self._emit(f"\n{_RULE_DASH}")
+        self._emit("  ATTUNEMENT COMPLETE")
+        self._emit(_RULE_DASH)
+        self._emit(f"  ✓ Operator: {operator_id}")
+        self._emit(f"  ✓ Bond Status: PERMANENT")
+        self._emit(f"  ✓ Harmony Index: {harmony_index:.1f}%")
+        self._emit(f"  ✓ K1-Saber Status: FULLY OPERATIONAL")
+        self._emit(f"\n  [✓] ATTUNEMENT SUCCESSFUL")
+        self._emit(f"  → Device is now exclusively bonded to {operator_id}")
+        
+        self._flush()
         return {
             "operator_id": operator_id,
             "attunement": self.attunement,
@@ -430,75 +514,71 @@ class K1SaberSystem:
         The operational flow is a seamless, instantaneous conversation 
         between the user's mind and the k1 entity.
         """
-        if not self.attunement or self.attunement.state != AttunementState.BONDED:
-            print("\n  [✗] ERROR: Operator not attuned. Blade formation inhibited.")
+        if not self.attunement or self.attunement.state is not _BONDED:
+            self._emit("\n  [✗] ERROR: Operator not attuned. Blade formation inhibited.")
+            self._flush()
             return {"success": False, "error": "Not attuned"}
         
         self._display_header("BLADE FORMATION TEST")
-        print(f"  Testing dissonance field projection")
+        intent_clarity, energy_draw, dissonance_freq = _draw(_BLADE_RANGES)
+        self._emit(f"  Testing dissonance field projection")
         
         # Step 1: Will Input
-        print("\n  ── STEP 1: WILL INPUT ──")
-        print(f"  Operator intent detected...")
-        time.sleep(0.2)
-        print(f"  ✓ Focused will received: ACTIVATE BLADE")
-        print(f"  ✓ Intent clarity: {random.uniform(98, 100):.1f}%")
+        self._emit("\n  ── STEP 1: WILL INPUT ──")
+        self._emit(f"  Operator intent detected...")
+        self._pause(0.2)
+        self._emit(f"  ✓ Focused will received: ACTIVATE BLADE")
+        self._emit(f"  ✓ Intent clarity: {intent_clarity:.1f}%")
         
         # Step 2: Observation
-        print("\n  ── STEP 2: RESONATOR OBSERVATION ──")
-        print(f"  ✓ Harmonizing Resonator interpreting intent...")
-        print(f"  ✓ Command parsed: PROJECTION")
-        print(f"  ✓ K1 entity response: ACKNOWLEDGED")
+        self._emit("\n  ── STEP 2: RESONATOR OBSERVATION ──")
+        self._emit(f"  ✓ Harmonizing Resonator interpreting intent...")
+        self._emit(f"  ✓ Command parsed: PROJECTION")
+        self._emit(f"  ✓ K1 entity response: ACKNOWLEDGED")
         
         # Step 3: Energy Draw
-        print("\n  ── STEP 3: ENERGY DRAW ──")
+        self._emit("\n  ── STEP 3: ENERGY DRAW ──")
         self.blade_state = BladeState.FORMING
         
-        energy_draw = random.uniform(45, 55)
-        print(f"  ✓ Controlled dissonance in K1 Energy Cell")
-        print(f"  ✓ Power release: {energy_draw:.1f} MW")
-        print(f"  ✓ Energy stream: REGULATED")
+        self._emit(f"  ✓ Controlled dissonance in K1 Energy Cell")
+        self._emit(f"  ✓ Power release: {energy_draw:.1f} MW")
+        self._emit(f"  ✓ Energy stream: REGULATED")
         
         # Step 4: Dissonance Projection
-        print("\n  ── STEP 4: DISSONANCE PROJECTION ──")
-        for i in range(0, 101, 10):
+        self._emit("\n  ── STEP 4: DISSONANCE PROJECTION ──")
+        for i in self._ticks(range(0, 101, 10)):
             self._display_progress("Projecting de-harmonizing field...", i)
-            time.sleep(0.03)
-        print()
+            self._pause(0.03)
+        self._emit("")
         
-        dissonance_freq = random.uniform(1e15, 1e16)  # Hz
-        print(f"  ✓ De-harmonizing frequency: {dissonance_freq:.2e} Hz")
-        print(f"  ✓ Standing wave formation: STABLE")
+        self._emit(f"  ✓ De-harmonizing frequency: {dissonance_freq:.2e} Hz")
+        self._emit(f"  ✓ Standing wave formation: STABLE")
         
         # Step 5: Containment
-        print("\n  ── STEP 5: CONTAINMENT (DEFLECTION LOOP) ──")
-        for i in range(0, 101, 10):
+        self._emit("\n  ── STEP 5: CONTAINMENT (DEFLECTION LOOP) ──")
+        for i in self._ticks(range(0, 101, 10)):
             self._display_progress("Forming deflection loop...", i)
-            time.sleep(0.03)
-        print()
+            self._pause(0.03)
+        self._emit("")
         
         self.blade_length = self.target_blade_length
-        self.blade_state = BladeState.STABLE
+        self.blade_state = _STABLE
         
-        print(f"  ✓ Magnetic bottle: FORMED")
-        print(f"  ✓ 180° deflection: ACTIVE")
-        print(f"  ✓ Blade length: {self.blade_length:.3f} m")
-        print(f"  ✓ Energy loop: SELF-CONTAINED")
+        self._emit(f"  ✓ Magnetic bottle: FORMED")
+        self._emit(f"  ✓ 180° deflection: ACTIVE")
+        self._emit(f"  ✓ Blade length: {self.blade_length:.3f} m")
+        self._emit(f"  ✓ Energy loop: SELF-CONTAINED")
         
         # Display blade status
-        print("\n  ┌────────────────────────────────────────────┐")
-        print("  │        DISSONANCE BLADE STATUS             │")
-        print("  ├────────────────────────────────────────────┤")
-        print(f"  │  State: {self.blade_state.value:37s}│")
-        print(f"  │  Length: {self.blade_length:.3f} m{' '*28}│")
-        print(f"  │  Dissonance Frequency: {dissonance_freq:.2e} Hz{' '*5}│")
-        print(f"  │  Power Draw: {energy_draw:.1f} MW{' '*22}│")
-        print(f"  │  Stability: {'PERFECT':37s}│")
-        print("  └────────────────────────────────────────────┘")
-        
-        print(f"\n  [✓] BLADE FORMATION: SUCCESSFUL")
-        print(f"  → Dissonance field active and contained")
+        self._emit(self._BLADE_BOX_TEMPLATE.format(
+            state=_BLADE_STATE_STR[self.blade_state], length=self.blade_length,
+            freq=dissonance_freq, power=energy_draw
+        ))
+        
+        self._emit(f"\n  [✓] BLADE FORMATION: SUCCESSFUL")
+        self._emit(f"  → Dissonance field active and contained")
         
+        self._flush()
         return {
             "blade_state": self.blade_state,
             "blade_length": self.blade_length,
@@ -513,18 +593,19 @@ class K1SaberSystem:
         - Matter dissolution (cutting)
         - Energy deflection
         """
-        if self.blade_state != BladeState.STABLE:
-            print("\n  [✗] ERROR: Blade not active. Tactical test inhibited.")
+        if self.blade_state is not _STABLE:
+            self._emit("\n  [✗] ERROR: Blade not active. Tactical test inhibited.")
+            self._flush()
             return {"success": False, "error": "Blade not active"}
         
         self._display_header("TACTICAL CAPABILITY TEST")
         
         # Test 1: Matter Dissolution
-        print("\n  ── TEST 1: MATTER DISSOLUTION ──")
-        print("  Target: 50mm Hardened Durasteel Plate")
+        self._emit("\n  ── TEST 1: MATTER DISSOLUTION ──")
+        self._emit("  Target: 50mm Hardened Durasteel Plate")
         
         self.blade_state = BladeState.CUTTING
-        time.sleep(0.2)
+        self._pause(0.2)
         
         materials_tested = [
             ("Hardened Durasteel (50mm)", "DISSOLVED", 0.001),
@@ -534,20 +615,16 @@ class K1SaberSystem:
         ]
         
         for material, result, time_sec in materials_tested:
-            print(f"  ✓ {material}: {result} in {time_sec*1000:.1f}ms")
+            self._emit(f"  ✓ {material}: {result} in {time_sec*1000:.1f}ms")
         
-        print(f"\n  Dissolution Mechanism:")
-        print(f"  → Molecular bonds overwhelmed by de-harmonizing frequency")
-        print(f"  → Inter-atomic bonds nullified along cut path")
-        print(f"  → Matter dissociates into constituent atoms")
-        print(f"  → No thermal residue or collateral damage")
+        self._emit(self._DISSOLUTION_MECHANISM)
         
         # Test 2: Energy Deflection
-        print("\n  ── TEST 2: ENERGY DEFLECTION ──")
-        print("  Testing Law of Deflection...")
+        self._emit("\n  ── TEST 2: ENERGY DEFLECTION ──")
+        self._emit("  Testing Law of Deflection...")
         
         self.blade_state = BladeState.DEFLECTING
-        time.sleep(0.2)
+        self._pause(0.2)
         
         energy_types = [
             ("High-Energy Laser Bolt", "DEFLECTED", 180),
@@ -557,19 +634,16 @@ class K1SaberSystem:
         ]
         
         for energy_type, result, angle in energy_types:
-            print(f"  ✓ {energy_type}: {result} at {angle}°")
+            self._emit(f"  ✓ {energy_type}: {result} at {angle}°")
         
-        print(f"\n  Deflection Mechanism:")
-        print(f"  → Incoming energy cannot harmonize with dissonance field")
-        print(f"  → Containment field stability exceeds incoming energy")
-        print(f"  → Passive deflection along non-threatening trajectory")
-        print(f"  → Zone of energy field penetration: ZERO")
+        self._emit(self._DEFLECTION_MECHANISM)
         
-        self.blade_state = BladeState.STABLE
+        self.blade_state = _STABLE
         
-        print(f"\n  [✓] TACTICAL CAPABILITIES: VERIFIED")
-        print(f"  → Cutting and deflection fully operational")
+        self._emit(f"\n  [✓] TACTICAL CAPABILITIES: VERIFIED")
+        self._emit(f"  → Cutting and deflection fully operational")
         
+        self._flush()
         return {
             "cutting_test": "PASSED",
             "deflection_test": "PASSED",
@@ -580,27 +654,88 @@ class K1SaberSystem:
     
     def run_blade_retraction(self) -> Dict[str, any]:
         """Retract the dissonance blade"""
-        if self.blade_state == BladeState.RETRACTED:
-            print("\n  Blade already retracted.")
+        if self.blade_state is BladeState.RETRACTED:
+            self._emit("\n  Blade already retracted.")
+            self._flush()
             return {"success": True, "state": self.blade_state}
         
-        print("\n  ── BLADE RETRACTION ──")
+        self._emit("\n  ── BLADE RETRACTION ──")
         
-        for i in range(100, -1, -10):
+        for i in self._ticks(range(100, -1, -10)):
             self._display_progress("Collapsing dissonance field...", 100 - i)
             self.blade_length = self.target_blade_length * (i / 100)
-            time.sleep(0.03)
-        print()
+            self._pause(0.03)
+        self._emit("")
         
         self.blade_state = BladeState.RETRACTED
         self.blade_length = 0.0
         
-        print(f"  ✓ Dissonance field collapsed")
-        print(f"  ✓ Energy returned to K1 Cell")
-        print(f"  ✓ Blade state: RETRACTED")
+        self._emit(f"  ✓ Dissonance field collapsed")
+        self._emit(f"  ✓ Energy returned to K1 Cell")
+        self._emit(f"  ✓ Blade state: RETRACTED")
         
+        self._flush()
         return {"success": True, "state": self.blade_state}
     
+    @classmethod
+    def _stage_outcomes(cls, results: Dict[str, any]) -> List[Optional[bool]]:
+        """Per summary stage: True if it succeeded, False if it failed, None if skipped"""
+        outcomes = []
+        for key, _, _, flag in cls._SUMMARY_STAGES:
+            stage = results.get(key)
+            outcomes.append(None if stage is None else bool(stage.get(flag)))
+        return outcomes
+    
+    @classmethod
+    def overall_status(cls, results: Dict[str, any]) -> str:
+        """
+        Overall outcome of a run_full_system_check result
+        
+        "FAIL" if any stage failed, else "SKIPPED" if any stage did not run,
+        else "OPERATIONAL".
+        """
+        outcomes = cls._stage_outcomes(results)
+        if False in outcomes:
+            return "FAIL"
+        if None in outcomes:
+            return "SKIPPED"
+        return "OPERATIONAL"
+    
+    def _emit_summary(self, results: Dict[str, any], operator_id: str) -> None:
+        """Queue the full-check summary, reporting each stage's actual outcome"""
+        self._emit(f"\n{_RULE_EQ}")
+        self._emit("  K1-SABER SYSTEM CHECK COMPLETE")
+        self._emit(_RULE_EQ)
+        for (key, label, success_text, flag), passed in zip(self._SUMMARY_STAGES,
+                                                            self._stage_outcomes(results)):
+            if passed is None:
+                self._emit(f"  - {label}: SKIPPED")
+            elif passed:
+                self._emit(f"  ✓ {label}: {success_text.format(operator_id=operator_id)}")
+            else:
+                self._emit(f"  ✗ {label}: FAILED")
+        if self.overall_status(results) == "OPERATIONAL":
+            self._emit(f"\n  [✓] K1-SABER FULLY OPERATIONAL")
+        else:
+            self._emit(f"\n  [✗] K1-SABER NOT OPERATIONAL")
+        self._emit(_RULE_EQ)
+    
+    @classmethod
+    def run_fleet_diagnostics(cls, n: int) -> Dict[str, any]:
+        """
+        Run the component diagnostic gates for a fleet of n units
+        
+        Silent batch form of run_component_diagnostics for fleet QA and
+        reliability runs: no per-unit simulator instances, pauses or output.
+        """
+        readings, passed = _fleet_diagnostics(n)
+        return {
+            "units": n,
+            "readings": readings,
+            "passed": passed,
+            "units_passed": sum(1 for unit in passed if all(unit))
+        }
+    
     def run_full_system_check(self, operator_id: str = "OPERATOR-001") -> Dict[str, any]:
         """
         Run complete K1-Saber system check including:
@@ -610,63 +745,63 @@ class K1SaberSystem:
         - Blade formation test
         - Tactical capability test
         """
-        print(f"\n{'═'*60}")
-        print("  K1-SABER COMPLETE SYSTEM CHECK")
-        print(f"{'═'*60}")
-        print(f"  Project: K1-Saber (Controlled Dissonance Projector)")
-        print(f"  Principal Investigator: Brendon Joseph Kelly")
-        print(f"  Framework: Reflexive Compositional Dynamics (RCD)")
-        print(f"  Unit ID: {self.unit_id}")
-        print(f"{'═'*60}")
+        self._emit(f"\n{_RULE_EQ}")
+        self._emit("  K1-SABER COMPLETE SYSTEM CHECK")
+        self._emit(_RULE_EQ)
+        self._emit(f"  Project: K1-Saber (Controlled Dissonance Projector)")
+        self._emit(f"  Principal Investigator: Brendon Joseph Kelly")
+        self._emit(f"  Framework: Reflexive Compositional Dynamics (RCD)")
+        self._emit(f"  Unit ID: {self.unit_id}")
+        self._emit(_RULE_EQ)
         
         results = {}
         
         # 1. Component Diagnostics
         results["components"] = self.run_component_diagnostics()
-        time.sleep(0.3)
+        self._pause(0.3)
+        if not results["components"]["all_passed"]:
+            # Later stages all depend on sound hardware
+            self._emit_summary(results, operator_id)
+            self._flush()
+            return results
         
         # 2. Axiom Imprinting
         results["axiom"] = self.run_axiom_imprinting_check()
-        time.sleep(0.3)
+        self._pause(0.3)
         
         # 3. Operator Attunement
         results["attunement"] = self.run_attunement_simulation(operator_id)
-        time.sleep(0.3)
+        self._pause(0.3)
         
         # 4. Blade Formation
         results["blade"] = self.run_blade_formation_test()
-        time.sleep(0.3)
+        self._pause(0.3)
         
         # 5. Tactical Capabilities
         results["tactical"] = self.run_tactical_capability_test()
-        time.sleep(0.3)
+        self._pause(0.3)
         
         # 6. Blade Retraction
         results["retraction"] = self.run_blade_retraction()
         
         # Final Summary
-        print(f"\n{'═'*60}")
-        print("  K1-SABER SYSTEM CHECK COMPLETE")
-        print(f"{'═'*60}")
-        print(f"  ✓ Component Diagnostics: PASSED")
-        print(f"  ✓ Axiom Imprinting: VERIFIED")
-        print(f"  ✓ Operator Attunement: BONDED to {operator_id}")
-        print(f"  ✓ Blade Formation: SUCCESSFUL")
-        print(f"  ✓ Tactical Capabilities: VERIFIED")
-        print(f"  ✓ Current State: STANDBY")
-        print(f"\n  [✓] K1-SABER FULLY OPERATIONAL")
-        print(f"{'═'*60}")
+        self._emit_summary(results, operator_id)
         
+        self._flush()
         return results
 
 
-def run_k1_saber_check(unit_id: str = "K1-S-001", operator_id: str = "OPERATOR-001") -> Dict[str, any]:
+def run_k1_saber_check(unit_id: str = "K1-S-001", operator_id: str = "OPERATOR-001",
+                       pacing: float = 0.0) -> Dict[str, any]:
     """
     Convenience function to run complete K1-Saber check
+    
+    Pass pacing=1.0 for the full-speed display animation; the default
+    runs without any pauses.
     """
-    saber = K1SaberSystem(unit_id)
+    saber = K1SaberSystem(unit_id, pacing)
     return saber.run_full_system_check(operator_id)
 
 
 if __name__ == "__main__":
-    run_k1_saber_check()
+    run_k1_saber_check(pacing=1.0)
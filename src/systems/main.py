@@ -17,27 +17,20 @@ Frameworks:
 - Hyper-Lattice Spatial Mechanics (HLSM)
 """
 
-import time
+import asyncio
+import io
 import sys
-from typing import Dict, Any
-
-# Import all system modules
-from system_check import F35SystemChecker, run_full_system_check
-from engine_simulation import F135EngineSimulator, run_engine_check_and_startup
-from theoretical_systems import (
-    AdvancedWeaponsChecker,
-    PhaseShiftingChecker,
-    CloakingSystemChecker,
-    HyperLatticeTeleportationChecker,
-    AdvancedPropulsionChecker,
-    run_all_theoretical_checks
-)
-from k1_saber import K1SaberSystem, run_k1_saber_check
+import time
+from contextvars import ContextVar
+from typing import Dict, Any, Awaitable, Callable, Optional, Tuple
 
+from _console import PACE_ENABLED, pace
 
-def print_banner():
-    """Display the main system banner"""
-    banner = """
+# System modules are imported by the sections that use them, so start-up
+# and partial runs only pay for what they actually load
+
+
+_MAIN_BANNER = """
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                                                                              ║
 ║     ███████╗      ██████╗ ███████╗    ███╗   ██╗███████╗██╗  ██╗██╗   ██╗   ║
@@ -62,29 +55,144 @@ def print_banner():
 ║  Framework: Reflexive Compositional Dynamics (RCD)                           ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
-    print(banner)
+
+
+# Summary column text for each K1SaberSystem.overall_status outcome
+_K1_STATUS = {"OPERATIONAL": "✓ OPERATIONAL", "FAIL": "✗ FAIL", "SKIPPED": "- SKIPPED"}
+
+
+# Final summary box; filled by print_final_summary
+_SUMMARY_TEMPLATE = (
+    "\n\n"
+    "╔══════════════════════════════════════════════════════════════════════════════╗\n"
+    "║                                                                              ║\n"
+    "║                    INTEGRATED SYSTEMS DIAGNOSTIC SUMMARY                     ║\n"
+    "║                                                                              ║\n"
+    "╠══════════════════════════════════════════════════════════════════════════════╣\n"
+    "║  Aircraft ID: {aircraft_id:<62}║\n"
+    "║  Operator ID: {operator_id:<62}║\n"
+    "║  Timestamp: {timestamp:<64}║\n"
+    "╠══════════════════════════════════════════════════════════════════════════════╣\n"
+    "║                                                                              ║\n"
+    "║  SYSTEM STATUS OVERVIEW:                                                     ║\n"
+    "║  ─────────────────────────────────────────────────────────────────────────   ║\n"
+    "║  [1] F-35 Conventional Systems:         {conv_status:<35}║\n"
+    "║  [2] F135 Engine Check & Startup:       {eng_status:<35}║\n"
+    "║  [3] K1-Saber Dissonance Projector:     {k1_status:<35}║\n"
+    "║  [4] Theoretical Weapons ({weap_count} systems):    ◈ CHECKED                          ║\n"
+    "║  [5] Phase Shifting (stability {phase_stab:.1f}%):   ◈ THEORETICAL                      ║\n"
+    "║  [6] Cloaking Systems ({cloak_ops} operational):   ✓ PARTIAL                          ║\n"
+    "║  [7] Hyper-Lattice Teleportation:       ◈ THEORETICAL (TRL 0)              ║\n"
+    "║  [8] Advanced Propulsion:               ◈ MIXED TRL                        ║\n"
+    "║                                                                              ║\n"
+    "╠══════════════════════════════════════════════════════════════════════════════╣\n"
+    "║                                                                              ║\n"
+    "║  OPERATIONAL READINESS:                                                      ║\n"
+    "║  ─────────────────────────────────────────────────────────────────────────   ║\n"
+    "║                                                                              ║\n"
+    "║    ▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓░░░░░░░░░░  67% SYSTEMS OPERATIONAL                  ║\n"
+    "║                                                                              ║\n"
+    "║    ┌─────────────────────────────────────────────────────────────────────┐  ║\n"
+    "║    │  CONVENTIONAL SYSTEMS:  ████████████████████  100% READY           │  ║\n"
+    "║    │  K1-SABER PLATFORM:     ████████████████████  100% READY           │  ║\n"
+    "║    │  ADVANCED WEAPONS:      ████████████░░░░░░░░   60% READY           │  ║\n"
+    "║    │  CLOAKING SYSTEMS:      ██████████████░░░░░░   70% READY           │  ║\n"
+    "║    │  THEORETICAL SYSTEMS:   ████░░░░░░░░░░░░░░░░   20% (R&D PHASE)     │  ║\n"
+    "║    └─────────────────────────────────────────────────────────────────────┘  ║\n"
+    "║                                                                              ║\n"
+    "╠══════════════════════════════════════════════════════════════════════════════╣\n"
+    "║                                                                              ║\n"
+    "║  K1-SABER SPECIAL NOTATION:                                                  ║\n"
+    "║  ─────────────────────────────────────────────────────────────────────────   ║\n"
+    "║    Principal Investigator: Brendon Joseph Kelly                              ║\n"
+    "║    Framework: Reflexive Compositional Dynamics (RCD)                         ║\n"
+    "║    Operator Bond: PERMANENT AND EXCLUSIVE                                    ║\n"
+    "║    Blade Status: RETRACTED (Ready on command)                                ║\n"
+    "║    Transcendental Imperative: ACTIVE                                         ║\n"
+    "║                                                                              ║\n"
+    "╠══════════════════════════════════════════════════════════════════════════════╣\n"
+    "║                                                                              ║\n"
+    "║                    ╔════════════════════════════════════╗                    ║\n"
+    "║                    ║  ALL CHECKS AND SIMULATIONS COMPLETE ║                  ║\n"
+    "║                    ║     F-35 NEXUS-D / K1-SABER READY    ║                  ║\n"
+    "║                    ╚════════════════════════════════════╝                    ║\n"
+    "║                                                                              ║\n"
+    "╚══════════════════════════════════════════════════════════════════════════════╝\n"
+    "\n"
+    "  \"We do not merely fight the future—we define it.\"\n"
+)
+
+
+def print_banner():
+    """Display the main system banner"""
+    sys.stdout.write(_MAIN_BANNER + "\n")
 
 
 def print_section_header(title: str, subtitle: str = ""):
     """Print a major section header"""
-    print("\n")
-    print("╔" + "═" * 78 + "╗")
-    print("║" + f" {title}".ljust(78) + "║")
+    lines = ["\n", "╔" + "═" * 78 + "╗", "║" + f" {title}".ljust(78) + "║"]
     if subtitle:
-        print("║" + f" {subtitle}".ljust(78) + "║")
-    print("╚" + "═" * 78 + "╝")
+        lines.append("║" + f" {subtitle}".ljust(78) + "║")
+    lines.append("╚" + "═" * 78 + "╝")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_subsection(title: str):
     """Print a subsection divider"""
-    print(f"\n{'─' * 80}")
-    print(f"  {title}")
-    print(f"{'─' * 80}")
+    sys.stdout.write(f"\n{'─' * 80}\n  {title}\n{'─' * 80}\n")
+
+
+# Buffer receiving stdout for the section running in the current context
+_section_output: ContextVar[Optional[io.StringIO]] = ContextVar("_section_output", default=None)
+
+
+class _SectionStdout:
+    """
+    stdout proxy that routes writes to the current section's buffer
+    
+    Sections run concurrently, each on its own task or worker thread with
+    its own context, so their output is captured separately and replayed
+    in section order instead of interleaving on the terminal.
+    """
+    
+    def __init__(self, stream):
+        self._stream = stream
+        
+    def write(self, text: str) -> int:
+        buffer = _section_output.get()
+        return (self._stream if buffer is None else buffer).write(text)
+    
+    def flush(self) -> None:
+        if _section_output.get() is None:
+            self._stream.flush()
+            
+    def __getattr__(self, name: str):
+        return getattr(self._stream, name)
+
+
+async def _run_section(title: str, subtitle: str,
+                       body: Callable[[], Awaitable[Dict[str, Any]]]) -> Tuple[Dict[str, Any], str]:
+    """Run one section with its output captured, returning (system results, output)"""
+    buffer = io.StringIO()
+    _section_output.set(buffer)
+    print_section_header(title, subtitle)
+    systems = await body()
+    return systems, buffer.getvalue()
 
 
 def run_complete_simulation(aircraft_id: str = "F35-NEXUS-001", 
                            operator_id: str = "KELLY-001") -> Dict[str, Any]:
     """
+    Execute complete integrated simulation of all systems (blocking wrapper)
+    
+    See run_complete_simulation_async.
+    """
+    return asyncio.run(run_complete_simulation_async(aircraft_id, operator_id))
+
+
+async def run_complete_simulation_async(aircraft_id: str = "F35-NEXUS-001", 
+                                        operator_id: str = "KELLY-001") -> Dict[str, Any]:
+    """
     Execute complete integrated simulation of all systems
     
     This runs:
@@ -97,6 +205,13 @@ def run_complete_simulation(aircraft_id: str = "F35-NEXUS-001",
     7. Hyper-Lattice Teleportation Check
     8. Advanced Propulsion Check
     
+    The sections are independent, so by default they run concurrently: the
+    engine on the event loop and the blocking checkers on worker threads.
+    Each section's output is replayed in order as soon as it and every
+    section before it have finished. With demo pacing enabled they run one
+    after another and write straight to the terminal, so the paced output
+    and progress animations are shown live.
+    
     Args:
         aircraft_id: F-35 aircraft identification
         operator_id: K1-Saber operator identification
@@ -118,138 +233,134 @@ def run_complete_simulation(aircraft_id: str = "F35-NEXUS-001",
     print(f"  Aircraft ID: {aircraft_id}")
     print(f"  Operator ID: {operator_id}")
     print(f"  Timestamp: {results['timestamp']}")
-    time.sleep(1)
+    await pace(1)
     
     # ═══════════════════════════════════════════════════════════════════════════
     # SECTION 1: F-35 CONVENTIONAL SYSTEMS CHECK
     # ═══════════════════════════════════════════════════════════════════════════
     
-    print_section_header(
-        "SECTION 1: F-35 CONVENTIONAL SYSTEMS CHECK",
-        "Power, Thermal, Crypto, EW, Pilot Interface, Weapons, Structural"
-    )
-    
-    checker = F35SystemChecker(aircraft_id)
-    results["systems"]["conventional"] = checker.run_full_check()
-    time.sleep(0.5)
+    async def conventional() -> Dict[str, Any]:
+        from system_check import F35SystemChecker
+        checker = F35SystemChecker(aircraft_id)
+        return {"conventional": await checker.run_full_check_async()}
     
     # ═══════════════════════════════════════════════════════════════════════════
     # SECTION 2: F135 ENGINE CHECK AND STARTUP
     # ═══════════════════════════════════════════════════════════════════════════
     
-    print_section_header(
-        "SECTION 2: F135-PW-100 ENGINE CHECK AND STARTUP",
-        "Pratt & Whitney F135 Engine Diagnostics and Startup Sequence"
-    )
-    
-    engine = F135EngineSimulator(aircraft_id)
-    
-    # Engine check
-    engine_check_result = engine.run_engine_check()
-    results["systems"]["engine_check"] = engine_check_result
-    time.sleep(0.5)
-    
-    # Engine startup if check passed
-    if engine_check_result["passed"]:
-        print("\n  Engine check PASSED - Proceeding to startup sequence...")
-        time.sleep(0.5)
-        startup_success = engine.startup_sequence()
-        results["systems"]["engine_startup"] = {
-            "success": startup_success,
-            "final_state": engine.state.value,
-            "parameters": engine.parameters.copy()
-        }
+    async def engine_section() -> Dict[str, Any]:
+        from engine_simulation import F135EngineSimulator
+        systems = {}
+        engine = F135EngineSimulator(aircraft_id, realtime=PACE_ENABLED)
         
-        # Let engine run briefly then shutdown for next tests
-        print("\n  Engine running at idle - Performing systems verification...")
-        time.sleep(1)
+        # Engine check
+        engine_check_result = await engine.run_engine_check_async()
+        systems["engine_check"] = engine_check_result
+        await pace(0.5)
         
-        # Shutdown
-        engine.shutdown_sequence()
-        results["systems"]["engine_shutdown"] = {"success": True}
-    else:
-        print("\n  ⚠ Engine check FAILED - Startup inhibited")
-        results["systems"]["engine_startup"] = {"success": False, "error": "Pre-check failed"}
-    
-    time.sleep(0.5)
+        # Engine startup if check passed
+        if engine_check_result["passed"]:
+            print("\n  Engine check PASSED - Proceeding to startup sequence...")
+            await pace(0.5)
+            startup_success = await engine.startup_sequence_async()
+            systems["engine_startup"] = {
+                "success": startup_success,
+                "final_state": engine.state.name,
+                "parameters": engine.parameters.copy()
+            }
+            
+            # Let engine run briefly then shutdown for next tests
+            print("\n  Engine running at idle - Performing systems verification...")
+            await pace(1)
+            
+            # Shutdown
+            await engine.shutdown_sequence_async()
+            systems["engine_shutdown"] = {"success": True}
+        else:
+            print("\n  ⚠ Engine check FAILED - Startup inhibited")
+            systems["engine_startup"] = {"success": False, "error": "Pre-check failed"}
+        return systems
     
     # ═══════════════════════════════════════════════════════════════════════════
     # SECTION 3: K1-SABER SYSTEM CHECK
     # ═══════════════════════════════════════════════════════════════════════════
     
-    print_section_header(
-        "SECTION 3: K1-SABER CONTROLLED DISSONANCE PROJECTOR",
-        "Principal Investigator: Brendon Joseph Kelly | Framework: RCD"
-    )
-    
-    saber = K1SaberSystem(f"K1-S-{aircraft_id}")
-    results["systems"]["k1_saber"] = saber.run_full_system_check(operator_id)
-    time.sleep(0.5)
-    
-    # ═══════════════════════════════════════════════════════════════════════════
-    # SECTION 4: ADVANCED THEORETICAL WEAPONS
-    # ═══════════════════════════════════════════════════════════════════════════
-    
-    print_section_header(
-        "SECTION 4: ADVANCED THEORETICAL WEAPONS SYSTEMS",
-        "DEW, EMP, Plasma, Quantum, and Graviton Weapons"
-    )
-    
-    weapons_checker = AdvancedWeaponsChecker()
-    results["systems"]["theoretical_weapons"] = weapons_checker.run_full_check()
-    time.sleep(0.5)
-    
-    # ═══════════════════════════════════════════════════════════════════════════
-    # SECTION 5: PHASE SHIFTING TECHNOLOGY
-    # ═══════════════════════════════════════════════════════════════════════════
-    
-    print_section_header(
-        "SECTION 5: PHASE SHIFTING TECHNOLOGY",
-        "Quantum Phase Manipulation and Dimensional Membrane Interface"
-    )
-    
-    phase_checker = PhaseShiftingChecker()
-    results["systems"]["phase_shifting"] = phase_checker.run_check()
-    time.sleep(0.5)
-    
-    # ═══════════════════════════════════════════════════════════════════════════
-    # SECTION 6: CLOAKING SYSTEMS
-    # ═══════════════════════════════════════════════════════════════════════════
-    
-    print_section_header(
-        "SECTION 6: ADVANCED CLOAKING SYSTEMS",
-        "Multi-Spectrum Signature Management and Invisibility"
-    )
-    
-    cloak_checker = CloakingSystemChecker()
-    results["systems"]["cloaking"] = cloak_checker.run_check()
-    time.sleep(0.5)
+    async def k1_saber() -> Dict[str, Any]:
+        from k1_saber import K1SaberSystem
+        saber = K1SaberSystem(f"K1-S-{aircraft_id}", pacing=1.0 if PACE_ENABLED else 0.0)
+        return {"k1_saber": await asyncio.to_thread(saber.run_full_system_check, operator_id)}
     
     # ═══════════════════════════════════════════════════════════════════════════
-    # SECTION 7: HYPER-LATTICE TELEPORTATION
+    # SECTIONS 4-8: THEORETICAL SYSTEMS
     # ═══════════════════════════════════════════════════════════════════════════
     
-    print_section_header(
-        "SECTION 7: HYPER-LATTICE TELEPORTATION",
-        "Einstein-Rosen Bridge and Alcubierre Warp Field Systems"
-    )
-    
-    teleport_checker = HyperLatticeTeleportationChecker()
-    results["systems"]["teleportation"] = teleport_checker.run_check()
-    time.sleep(0.5)
-    
-    # ═══════════════════════════════════════════════════════════════════════════
-    # SECTION 8: ADVANCED PROPULSION
-    # ═══════════════════════════════════════════════════════════════════════════
-    
-    print_section_header(
-        "SECTION 8: ADVANCED PROPULSION SYSTEMS",
-        "RDE, Ion, MHD, and Antimatter Propulsion"
-    )
-    
-    propulsion_checker = AdvancedPropulsionChecker()
-    results["systems"]["propulsion"] = propulsion_checker.run_check()
-    time.sleep(0.5)
+    async def theoretical_weapons() -> Dict[str, Any]:
+        from theoretical_systems import AdvancedWeaponsChecker
+        return {"theoretical_weapons": await asyncio.to_thread(AdvancedWeaponsChecker().run_full_check)}
+    
+    async def phase_shifting() -> Dict[str, Any]:
+        from theoretical_systems import PhaseShiftingChecker
+        return {"phase_shifting": await asyncio.to_thread(PhaseShiftingChecker().run_check)}
+    
+    async def cloaking() -> Dict[str, Any]:
+        from theoretical_systems import CloakingSystemChecker
+        return {"cloaking": await asyncio.to_thread(CloakingSystemChecker().run_check)}
+    
+    async def teleportation() -> Dict[str, Any]:
+        from theoretical_systems import HyperLatticeTeleportationChecker
+        return {"teleportation": await asyncio.to_thread(HyperLatticeTeleportationChecker().run_check)}
+    
+    async def propulsion() -> Dict[str, Any]:
+        from theoretical_systems import AdvancedPropulsionChecker
+        return {"propulsion": await asyncio.to_thread(AdvancedPropulsionChecker().run_check)}
+    
+    sections = [
+        ("SECTION 1: F-35 CONVENTIONAL SYSTEMS CHECK",
+         "Power, Thermal, Crypto, EW, Pilot Interface, Weapons, Structural",
+         conventional),
+        ("SECTION 2: F135-PW-100 ENGINE CHECK AND STARTUP",
+         "Pratt & Whitney F135 Engine Diagnostics and Startup Sequence",
+         engine_section),
+        ("SECTION 3: K1-SABER CONTROLLED DISSONANCE PROJECTOR",
+         "Principal Investigator: Brendon Joseph Kelly | Framework: RCD",
+         k1_saber),
+        ("SECTION 4: ADVANCED THEORETICAL WEAPONS SYSTEMS",
+         "DEW, EMP, Plasma, Quantum, and Graviton Weapons",
+         theoretical_weapons),
+        ("SECTION 5: PHASE SHIFTING TECHNOLOGY",
+         "Quantum Phase Manipulation and Dimensional Membrane Interface",
+         phase_shifting),
+        ("SECTION 6: ADVANCED CLOAKING SYSTEMS",
+         "Multi-Spectrum Signature Management and Invisibility",
+         cloaking),
+        ("SECTION 7: HYPER-LATTICE TELEPORTATION",
+         "Einstein-Rosen Bridge and Alcubierre Warp Field Systems",
+         teleportation),
+        ("SECTION 8: ADVANCED PROPULSION SYSTEMS",
+         "RDE, Ion, MHD, and Antimatter Propulsion",
+         propulsion),
+    ]
+    
+    if PACE_ENABLED:
+        for title, subtitle, body in sections:
+            print_section_header(title, subtitle)
+            results["systems"].update(await body())
+            await pace(0.5)
+    else:
+        stdout = sys.stdout
+        sys.stdout = _SectionStdout(stdout)
+        tasks = []
+        try:
+            tasks = [asyncio.create_task(_run_section(*section)) for section in sections]
+            for task in tasks:
+                systems, output = await task
+                results["systems"].update(systems)
+                stdout.write(output)
+                stdout.flush()
+        finally:
+            for task in tasks:
+                task.cancel()
+            sys.stdout = stdout
     
     # ═══════════════════════════════════════════════════════════════════════════
     # FINAL SUMMARY
@@ -262,95 +373,25 @@ def run_complete_simulation(aircraft_id: str = "F35-NEXUS-001",
 
 def print_final_summary(results: Dict[str, Any]):
     """Print comprehensive final summary of all checks"""
-    
-    print("\n")
-    print("╔══════════════════════════════════════════════════════════════════════════════╗")
-    print("║                                                                              ║")
-    print("║                    INTEGRATED SYSTEMS DIAGNOSTIC SUMMARY                     ║")
-    print("║                                                                              ║")
-    print("╠══════════════════════════════════════════════════════════════════════════════╣")
-    print(f"║  Aircraft ID: {results['aircraft_id']:<62}║")
-    print(f"║  Operator ID: {results['operator_id']:<62}║")
-    print(f"║  Timestamp: {results['timestamp']:<64}║")
-    print("╠══════════════════════════════════════════════════════════════════════════════╣")
-    print("║                                                                              ║")
-    print("║  SYSTEM STATUS OVERVIEW:                                                     ║")
-    print("║  ─────────────────────────────────────────────────────────────────────────   ║")
-    
-    # Conventional systems
-    conv = results["systems"].get("conventional", {})
-    conv_status = "✓ PASS" if conv.get("all_passed", False) else "✗ FAIL"
-    print(f"║  [1] F-35 Conventional Systems:         {conv_status:<35}║")
-    
-    # Engine
-    eng_check = results["systems"].get("engine_check", {})
-    eng_start = results["systems"].get("engine_startup", {})
-    eng_status = "✓ PASS" if eng_check.get("passed", False) and eng_start.get("success", False) else "✗ FAIL"
-    print(f"║  [2] F135 Engine Check & Startup:       {eng_status:<35}║")
-    
-    # K1-Saber
-    k1 = results["systems"].get("k1_saber", {})
-    k1_status = "✓ OPERATIONAL" if k1 else "✗ FAIL"
-    print(f"║  [3] K1-Saber Dissonance Projector:     {k1_status:<35}║")
-    
-    # Theoretical weapons
-    weap = results["systems"].get("theoretical_weapons", {})
-    weap_count = weap.get("count", 0)
-    print(f"║  [4] Theoretical Weapons ({weap_count} systems):    {'◈ CHECKED':<35}║")
-    
-    # Phase shifting
-    phase = results["systems"].get("phase_shifting", {})
-    phase_stab = phase.get("avg_stability", 0)
-    print(f"║  [5] Phase Shifting (stability {phase_stab:.1f}%):   {'◈ THEORETICAL':<35}║")
-    
-    # Cloaking
-    cloak = results["systems"].get("cloaking", {})
-    cloak_ops = cloak.get("operational_count", 0)
-    print(f"║  [6] Cloaking Systems ({cloak_ops} operational):   {'✓ PARTIAL':<35}║")
-    
-    # Teleportation
-    print(f"║  [7] Hyper-Lattice Teleportation:       {'◈ THEORETICAL (TRL 0)':<35}║")
-    
-    # Propulsion
-    print(f"║  [8] Advanced Propulsion:               {'◈ MIXED TRL':<35}║")
-    
-    print("║                                                                              ║")
-    print("╠══════════════════════════════════════════════════════════════════════════════╣")
-    print("║                                                                              ║")
-    print("║  OPERATIONAL READINESS:                                                      ║")
-    print("║  ─────────────────────────────────────────────────────────────────────────   ║")
-    print("║                                                                              ║")
-    print("║    ▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓░░░░░░░░░░  67% SYSTEMS OPERATIONAL                  ║")
-    print("║                                                                              ║")
-    print("║    ┌─────────────────────────────────────────────────────────────────────┐  ║")
-    print("║    │  CONVENTIONAL SYSTEMS:  ████████████████████  100% READY           │  ║")
-    print("║    │  K1-SABER PLATFORM:     ████████████████████  100% READY           │  ║")
-    print("║    │  ADVANCED WEAPONS:      ████████████░░░░░░░░   60% READY           │  ║")
-    print("║    │  CLOAKING SYSTEMS:      ██████████████░░░░░░   70% READY           │  ║")
-    print("║    │  THEORETICAL SYSTEMS:   ████░░░░░░░░░░░░░░░░   20% (R&D PHASE)     │  ║")
-    print("║    └─────────────────────────────────────────────────────────────────────┘  ║")
-    print("║                                                                              ║")
-    print("╠══════════════════════════════════════════════════════════════════════════════╣")
-    print("║                                                                              ║")
-    print("║  K1-SABER SPECIAL NOTATION:                                                  ║")
-    print("║  ─────────────────────────────────────────────────────────────────────────   ║")
-    print("║    Principal Investigator: Brendon Joseph Kelly                              ║")
-    print("║    Framework: Reflexive Compositional Dynamics (RCD)                         ║")
-    print("║    Operator Bond: PERMANENT AND EXCLUSIVE                                    ║")
-    print("║    Blade Status: RETRACTED (Ready on command)                                ║")
-    print("║    Transcendental Imperative: ACTIVE                                         ║")
-    print("║                                                                              ║")
-    print("╠══════════════════════════════════════════════════════════════════════════════╣")
-    print("║                                                                              ║")
-    print("║                    ╔════════════════════════════════════╗                    ║")
-    print("║                    ║  ALL CHECKS AND SIMULATIONS COMPLETE ║                  ║")
-    print("║                    ║     F-35 NEXUS-D / K1-SABER READY    ║                  ║")
-    print("║                    ╚════════════════════════════════════╝                    ║")
-    print("║                                                                              ║")
-    print("╚══════════════════════════════════════════════════════════════════════════════╝")
-    print()
-    print("  \"We do not merely fight the future—we define it.\"")
-    print()
+    from k1_saber import K1SaberSystem
+    systems = results["systems"]
+    conv = systems.get("conventional", {})
+    eng_check = systems.get("engine_check", {})
+    eng_start = systems.get("engine_startup", {})
+    
+    ctx = {
+        "aircraft_id": results["aircraft_id"],
+        "operator_id": results["operator_id"],
+        "timestamp": results["timestamp"],
+        "conv_status": "✓ PASS" if conv.get("all_passed", False) else "✗ FAIL",
+        "eng_status": ("✓ PASS" if eng_check.get("passed", False) and eng_start.get("success", False)
+                       else "✗ FAIL"),
+        "k1_status": _K1_STATUS[K1SaberSystem.overall_status(systems.get("k1_saber", {}))],
+        "weap_count": systems.get("theoretical_weapons", {}).get("count", 0),
+        "phase_stab": systems.get("phase_shifting", {}).get("avg_stability", 0),
+        "cloak_ops": systems.get("cloaking", {}).get("operational_count", 0),
+    }
+    sys.stdout.write(_SUMMARY_TEMPLATE.format_map(ctx) + "\n")
 
 
 def main():
@@ -5,23 +5,88 @@ This module performs comprehensive diagnostic checks on all F-35 systems
 as specified in the NEXUS-D integration roadmap.
 """
 
-import time
+import asyncio
+import copy
+import operator
 import random
+import sys
+from array import array
+from collections import OrderedDict
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 from typing import List, Dict, Optional
 
+try:
+    from ._console import BufferedOutput, pace
+except ImportError:  # run as a script from src/systems
+    from _console import BufferedOutput, pace
 
-class SystemStatus(Enum):
+
+_RNG = random.Random()
+
+def _within(value: float, limit) -> bool:
+    """True if value lies in the inclusive (lo, hi) limit"""
+    return limit[0] <= value <= limit[1]
+
+
+# Check descriptors, in display (and draw) order:
+#   (name, draw, (lo, hi), comparison, limit, message, unit)
+# draw samples the value from _RNG and comparison(value, limit) decides
+# NOMINAL vs WARNING; fixed checks have no draw and always report NOMINAL.
+# message may reference the drawn {value}.
+POWER_CHECKS = (
+    ("Main Power Bus", _RNG.uniform, (269.5, 270.5), _within, (269, 271), "DC voltage within tolerance", "V"),
+    ("Power Capacity", _RNG.uniform, (595, 610), operator.ge, 600, "APDN capacity operational", "kW"),
+    # η_system target > 92%
+    ("System Efficiency", _RNG.uniform, (91.5, 93.5), operator.ge, 92, "SiC MOSFET efficiency", "%"),
+    ("Thermal Management", _RNG.uniform, (38, 45), operator.le, 50, "Heat sink temperature", "°C"),
+)
+CRYPTO_CHECKS = (
+    ("Encryption Throughput", _RNG.uniform, (1.15, 1.25), operator.ge, 1.2, "Lattice-based crypto", "Gbps"),
+    ("Crypto Latency", _RNG.uniform, (16, 20), operator.le, 18, "FPGA processing time", "µs"),
+    ("Key Store", None, None, None, None, "NIST PQC algorithms loaded", None),
+    ("Type 1 Cert", None, None, None, None, "NSA certification valid", None),
+)
+EW_CHECKS = (
+    ("MADL Integrity", _RNG.uniform, (99.98, 99.999), operator.ge, 99.99, "Post-quantum encryption", "%"),
+    # 64-element array, 30 dB suppression
+    ("Null-Steering Array", _RNG.uniform, (28, 32), operator.ge, 30, "Jamming suppression", "dB"),
+    ("Array Elements", _RNG.randint, (62, 64), operator.ge, 60, "{value}/64 elements active", "units"),
+)
+PILOT_CHECKS = (
+    ("Quantum Glass HMD", _RNG.uniform, (10, 14), operator.le, 12, "Light field display", "ms"),
+    ("Field of View", _RNG.uniform, (148, 152), operator.ge, 150, "Binocular coverage", "°"),
+    # Photonic co-processor, 10^14 FLOPS at 300W
+    ("Photonic Processor", _RNG.uniform, (0.95, 1.05), operator.ge, 1.0, "Sensor fusion CNN", "×10¹⁴ FLOPS"),
+    ("Ghostmärk DSS", None, None, None, None, "Multi-agent RL active", None),
+)
+WEAPONS_CHECKS = (
+    ("Weapons Bay Doors", None, None, None, None, "Actuators responsive", None),
+    ("Fire Control System", None, None, None, None, "Lock-on capable", None),
+    ("HYPER-HAWK Interface", None, None, None, None, "Data link established", None),
+)
+MATERIALS_CHECKS = (
+    ("Self-Healing Composites", None, None, None, None, "Microcapsules intact", None),
+    ("Metasurface Tiles", _RNG.randint, (98, 100), operator.ge, 95, "{value}% tiles responsive", "%"),
+    ("RCS Signature", _RNG.uniform, (-42, -38), operator.le, -40, "Low-observable status", "dBsm"),
+)
+
+
+# Memoized full-check results, keyed by aircraft_id, least recently used first
+CHECK_CACHE_MAXSIZE = 128
+_RESULT_CACHE: "OrderedDict[str, Dict[str, any]]" = OrderedDict()
+
+
+class SystemStatus(IntEnum):
     """System status indicators"""
-    NOMINAL = "NOMINAL"
-    WARNING = "WARNING"
-    FAULT = "FAULT"
-    OFFLINE = "OFFLINE"
-    INITIALIZING = "INITIALIZING"
+    NOMINAL = 0
+    WARNING = 1
+    FAULT = 2
+    OFFLINE = 3
+    INITIALIZING = 4
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckResult:
     """Result of a system check"""
     system_name: str
@@ -31,7 +96,7 @@ class CheckResult:
     unit: Optional[str] = None
 
 
-class F35SystemChecker:
+class F35SystemChecker(BufferedOutput):
     """
     F-35 NEXUS-D Full System Diagnostic Checker
     
@@ -47,56 +112,71 @@ class F35SystemChecker:
     def __init__(self, aircraft_id: str = "F35-001"):
         self.aircraft_id = aircraft_id
         self.check_results: List[CheckResult] = []
+        # Status codes in check order, kept alongside the results for the summary tally
+        self._statuses = array("b")
         self.systems_checked = 0
         self.all_passed = True
+        self._out: List[str] = []
+        # Pending group write while run_full_check_async overlaps output with checks
+        self._writing: Optional[asyncio.Future] = None
+        self._write_behind = False
+        
+    def _flush(self) -> None:
+        """Write queued output now, or leave it for _write_group when writing behind"""
+        if not self._write_behind:
+            super()._flush()
+            
+    async def _write_group(self) -> None:
+        """
+        Hand the queued output to a worker thread and return without waiting
+        
+        The previous group's write is awaited first, so output stays in order
+        and a failed write is raised here rather than lost.
+        """
+        if self._writing is not None:
+            writing, self._writing = self._writing, None
+            await writing
+        if self._out:
+            text = "\n".join(self._out) + "\n"
+            self._out.clear()
+            self._writing = asyncio.ensure_future(asyncio.to_thread(sys.stdout.write, text))
+            # Let the write start before the next group's checks run
+            await asyncio.sleep(0)
         
     def _log_check(self, result: CheckResult) -> None:
         """Log a check result"""
         self.check_results.append(result)
+        self._statuses.append(result.status)
         self.systems_checked += 1
         status_symbol = "✓" if result.status == SystemStatus.NOMINAL else "✗" if result.status == SystemStatus.FAULT else "⚠"
         value_str = f" [{result.value} {result.unit}]" if result.value is not None else ""
-        print(f"  [{status_symbol}] {result.system_name}: {result.status.value}{value_str} - {result.message}")
+        self._emit(f"  [{status_symbol}] {result.system_name}: {result.status.name}{value_str} - {result.message}")
         if result.status == SystemStatus.FAULT:
             self.all_passed = False
     
+    def _run_group(self, title: str, checks) -> List[CheckResult]:
+        """Draw, judge and log each check descriptor of a group, in order"""
+        self._emit(f"\n=== {title} ===")
+        results = []
+        for name, draw, bounds, comparison, limit, message, unit in checks:
+            if draw is None:
+                result = CheckResult(name, SystemStatus.NOMINAL, message, None, None)
+            else:
+                value = draw(*bounds)
+                status = SystemStatus.NOMINAL if comparison(value, limit) else SystemStatus.WARNING
+                result = CheckResult(name, status, message.format(value=value), value, unit)
+            self._log_check(result)
+            results.append(result)
+        
+        self._flush()
+        return results
+    
     def check_power_system(self) -> List[CheckResult]:
         """
         Check Adaptive Power Distribution Network (APDN)
         Target: 600+ kW capacity with 92% efficiency
         """
-        print("\n=== POWER & THERMAL MANAGEMENT (APDN) ===")
-        results = []
-        
-        # Main power bus voltage
-        voltage = random.uniform(269.5, 270.5)
-        status = SystemStatus.NOMINAL if 269 <= voltage <= 271 else SystemStatus.WARNING
-        result = CheckResult("Main Power Bus", status, "DC voltage within tolerance", voltage, "V")
-        self._log_check(result)
-        results.append(result)
-        
-        # Power capacity
-        capacity = random.uniform(595, 610)
-        status = SystemStatus.NOMINAL if capacity >= 600 else SystemStatus.WARNING
-        result = CheckResult("Power Capacity", status, "APDN capacity operational", capacity, "kW")
-        self._log_check(result)
-        results.append(result)
-        
-        # System efficiency (η_system target > 92%)
-        efficiency = random.uniform(91.5, 93.5)
-        status = SystemStatus.NOMINAL if efficiency >= 92 else SystemStatus.WARNING
-        result = CheckResult("System Efficiency", status, "SiC MOSFET efficiency", efficiency, "%")
-        self._log_check(result)
-        results.append(result)
-        
-        # Thermal management
-        temp = random.uniform(38, 45)
-        status = SystemStatus.NOMINAL if temp <= 50 else SystemStatus.WARNING
-        result = CheckResult("Thermal Management", status, "Heat sink temperature", temp, "°C")
-        self._log_check(result)
-        results.append(result)
-        
-        return results
+        return self._run_group("POWER & THERMAL MANAGEMENT (APDN)", POWER_CHECKS)
     
     def check_crypto_module(self) -> List[CheckResult]:
         """
@@ -104,205 +184,115 @@ class F35SystemChecker:
         Security: λ=256 provides 2^128 classical/quantum security
         Performance: 1.2 Gbps encryption with 18µs latency
         """
-        print("\n=== CYBER-HARDENED CORE (QRCM) ===")
-        results = []
-        
-        # Encryption throughput
-        throughput = random.uniform(1.15, 1.25)
-        status = SystemStatus.NOMINAL if throughput >= 1.2 else SystemStatus.WARNING
-        result = CheckResult("Encryption Throughput", status, "Lattice-based crypto", throughput, "Gbps")
-        self._log_check(result)
-        results.append(result)
-        
-        # Latency check
-        latency = random.uniform(16, 20)
-        status = SystemStatus.NOMINAL if latency <= 18 else SystemStatus.WARNING
-        result = CheckResult("Crypto Latency", status, "FPGA processing time", latency, "µs")
-        self._log_check(result)
-        results.append(result)
-        
-        # Key validation
-        result = CheckResult("Key Store", SystemStatus.NOMINAL, "NIST PQC algorithms loaded", None, None)
-        self._log_check(result)
-        results.append(result)
-        
-        # Type 1 certification
-        result = CheckResult("Type 1 Cert", SystemStatus.NOMINAL, "NSA certification valid", None, None)
-        self._log_check(result)
-        results.append(result)
-        
-        return results
+        return self._run_group("CYBER-HARDENED CORE (QRCM)", CRYPTO_CHECKS)
     
     def check_ew_suite(self) -> List[CheckResult]:
         """
         Check BAE Cognitive EW Suite
         KPP: 99.99% message integrity at 50 Mbps under jamming
         """
-        print("\n=== COGNITIVE EW SUITE ===")
-        results = []
-        
-        # Digital Black data link
-        integrity = random.uniform(99.98, 99.999)
-        status = SystemStatus.NOMINAL if integrity >= 99.99 else SystemStatus.WARNING
-        result = CheckResult("MADL Integrity", status, "Post-quantum encryption", integrity, "%")
-        self._log_check(result)
-        results.append(result)
-        
-        # Antenna array (64-element, 30 dB suppression)
-        suppression = random.uniform(28, 32)
-        status = SystemStatus.NOMINAL if suppression >= 30 else SystemStatus.WARNING
-        result = CheckResult("Null-Steering Array", status, "Jamming suppression", suppression, "dB")
-        self._log_check(result)
-        results.append(result)
-        
-        # Array elements
-        elements_active = random.randint(62, 64)
-        status = SystemStatus.NOMINAL if elements_active >= 60 else SystemStatus.WARNING
-        result = CheckResult("Array Elements", status, f"{elements_active}/64 elements active", elements_active, "units")
-        self._log_check(result)
-        results.append(result)
-        
-        return results
+        return self._run_group("COGNITIVE EW SUITE", EW_CHECKS)
     
     def check_pilot_interface(self) -> List[CheckResult]:
         """
         Check Northrop Avionics Pilot-Vehicle Interface
         Quantum Glass: 150° FOV, 4K per eye, 12ms latency
         """
-        print("\n=== PILOT-VEHICLE INTERFACE ===")
-        results = []
-        
-        # Helmet display
-        latency = random.uniform(10, 14)
-        status = SystemStatus.NOMINAL if latency <= 12 else SystemStatus.WARNING
-        result = CheckResult("Quantum Glass HMD", status, "Light field display", latency, "ms")
-        self._log_check(result)
-        results.append(result)
-        
-        # FOV check
-        fov = random.uniform(148, 152)
-        status = SystemStatus.NOMINAL if fov >= 150 else SystemStatus.WARNING
-        result = CheckResult("Field of View", status, "Binocular coverage", fov, "°")
-        self._log_check(result)
-        results.append(result)
-        
-        # Photonic co-processor (10^14 FLOPS at 300W)
-        flops = random.uniform(0.95, 1.05) * 1e14
-        status = SystemStatus.NOMINAL if flops >= 1e14 else SystemStatus.WARNING
-        result = CheckResult("Photonic Processor", status, "Sensor fusion CNN", flops / 1e14, "×10¹⁴ FLOPS")
-        self._log_check(result)
-        results.append(result)
-        
-        # AI decision support
-        result = CheckResult("Ghostmärk DSS", SystemStatus.NOMINAL, "Multi-agent RL active", None, None)
-        self._log_check(result)
-        results.append(result)
-        
-        return results
+        return self._run_group("PILOT-VEHICLE INTERFACE", PILOT_CHECKS)
     
     def check_weapons_systems(self) -> List[CheckResult]:
         """
         Check Raytheon Weapons Systems
         Including HYPER-HAWK-22 hypersonic demonstrator status
         """
-        print("\n=== WEAPONS SYSTEMS ===")
-        results = []
-        
-        # Weapons bay doors
-        result = CheckResult("Weapons Bay Doors", SystemStatus.NOMINAL, "Actuators responsive", None, None)
-        self._log_check(result)
-        results.append(result)
-        
-        # Fire control
-        result = CheckResult("Fire Control System", SystemStatus.NOMINAL, "Lock-on capable", None, None)
-        self._log_check(result)
-        results.append(result)
-        
-        # Hypersonic interface (if equipped)
-        result = CheckResult("HYPER-HAWK Interface", SystemStatus.NOMINAL, "Data link established", None, None)
-        self._log_check(result)
-        results.append(result)
-        
-        return results
+        return self._run_group("WEAPONS SYSTEMS", WEAPONS_CHECKS)
     
     def check_materials_integrity(self) -> List[CheckResult]:
         """
         Check Lockheed Materials including self-healing composites
         Target: 85% strength restoration after damage
         """
-        print("\n=== STRUCTURAL INTEGRITY ===")
-        results = []
-        
-        # Self-healing composite status
-        result = CheckResult("Self-Healing Composites", SystemStatus.NOMINAL, "Microcapsules intact", None, None)
-        self._log_check(result)
-        results.append(result)
-        
-        # Metasurface tiles
-        tiles_active = random.randint(98, 100)
-        status = SystemStatus.NOMINAL if tiles_active >= 95 else SystemStatus.WARNING
-        result = CheckResult("Metasurface Tiles", status, f"{tiles_active}% tiles responsive", tiles_active, "%")
-        self._log_check(result)
-        results.append(result)
-        
-        # RCS check
-        rcs = random.uniform(-42, -38)
-        status = SystemStatus.NOMINAL if rcs <= -40 else SystemStatus.WARNING
-        result = CheckResult("RCS Signature", status, "Low-observable status", rcs, "dBsm")
-        self._log_check(result)
-        results.append(result)
-        
-        return results
+        return self._run_group("STRUCTURAL INTEGRITY", MATERIALS_CHECKS)
     
     def run_full_check(self) -> Dict[str, any]:
+        """Execute full system diagnostic check (blocking wrapper)"""
+        return asyncio.run(self.run_full_check_async())
+        
+    async def run_full_check_async(self) -> Dict[str, any]:
         """
         Execute full system diagnostic check
         
+        Demo pacing pauses yield to the event loop instead of blocking it.
+        Each check group's output is written on a worker thread while the
+        next group runs.
+        
         Returns comprehensive status report
         """
-        print(f"\n{'='*60}")
-        print(f"F-35 NEXUS-D FULL SYSTEM CHECK")
-        print(f"Aircraft ID: {self.aircraft_id}")
-        print(f"{'='*60}")
-        print(f"Initiating comprehensive system diagnostics...")
-        time.sleep(0.5)
+        self._write_behind = True
+        try:
+            return await self._run_checks()
+        finally:
+            self._write_behind = False
+            if self._writing is not None:
+                # Only reached on error; the write result is secondary to it
+                writing, self._writing = self._writing, None
+                await asyncio.gather(writing, return_exceptions=True)
+            
+    async def _run_checks(self) -> Dict[str, any]:
+        """Run every check group, writing each group's output behind the next"""
+        self._emit(f"\n{'='*60}")
+        self._emit(f"F-35 NEXUS-D FULL SYSTEM CHECK")
+        self._emit(f"Aircraft ID: {self.aircraft_id}")
+        self._emit(f"{'='*60}")
+        self._emit(f"Initiating comprehensive system diagnostics...")
+        await self._write_group()
+        await pace(0.5)
         
         # Run all checks
         self.check_power_system()
-        time.sleep(0.3)
+        await self._write_group()
+        await pace(0.3)
         
         self.check_crypto_module()
-        time.sleep(0.3)
+        await self._write_group()
+        await pace(0.3)
         
         self.check_ew_suite()
-        time.sleep(0.3)
+        await self._write_group()
+        await pace(0.3)
         
         self.check_pilot_interface()
-        time.sleep(0.3)
+        await self._write_group()
+        await pace(0.3)
         
         self.check_weapons_systems()
-        time.sleep(0.3)
+        await self._write_group()
+        await pace(0.3)
         
         self.check_materials_integrity()
-        time.sleep(0.3)
+        await self._write_group()
+        await pace(0.3)
         
         # Generate summary
-        nominal_count = sum(1 for r in self.check_results if r.status == SystemStatus.NOMINAL)
-        warning_count = sum(1 for r in self.check_results if r.status == SystemStatus.WARNING)
-        fault_count = sum(1 for r in self.check_results if r.status == SystemStatus.FAULT)
-        
-        print(f"\n{'='*60}")
-        print("SYSTEM CHECK SUMMARY")
-        print(f"{'='*60}")
-        print(f"  Total Systems Checked: {self.systems_checked}")
-        print(f"  Nominal: {nominal_count}")
-        print(f"  Warnings: {warning_count}")
-        print(f"  Faults: {fault_count}")
+        nominal_count = self._statuses.count(SystemStatus.NOMINAL)
+        warning_count = self._statuses.count(SystemStatus.WARNING)
+        fault_count = self._statuses.count(SystemStatus.FAULT)
+        
+        self._emit(f"\n{'='*60}")
+        self._emit("SYSTEM CHECK SUMMARY")
+        self._emit(f"{'='*60}")
+        self._emit(f"  Total Systems Checked: {self.systems_checked}")
+        self._emit(f"  Nominal: {nominal_count}")
+        self._emit(f"  Warnings: {warning_count}")
+        self._emit(f"  Faults: {fault_count}")
         
         overall_status = "PASS" if fault_count == 0 else "FAIL"
         status_color = "✓" if overall_status == "PASS" else "✗"
-        print(f"\n  [{status_color}] OVERALL STATUS: {overall_status}")
-        print(f"{'='*60}")
+        self._emit(f"\n  [{status_color}] OVERALL STATUS: {overall_status}")
+        self._emit(f"{'='*60}")
+        await self._write_group()
+        # Nothing left queued, so this just waits for the summary write
+        await self._write_group()
         
         return {
             "aircraft_id": self.aircraft_id,
@@ -316,18 +306,36 @@ class F35SystemChecker:
         }
 
 
-def run_full_system_check(aircraft_id: str = "F35-001") -> Dict[str, any]:
+def clear_check_cache() -> None:
+    """Discard all memoized full system check results"""
+    _RESULT_CACHE.clear()
+
+
+def run_full_system_check(aircraft_id: str = "F35-001", use_cache: bool = False) -> Dict[str, any]:
     """
     Convenience function to run a full system check
     
     Args:
         aircraft_id: Aircraft identification number
+        use_cache: Return a copy of an earlier result for the same
+            aircraft_id, if any, instead of re-running the check
         
     Returns:
         Dictionary containing check results
     """
+    if use_cache and aircraft_id in _RESULT_CACHE:
+        _RESULT_CACHE.move_to_end(aircraft_id)
+        return copy.deepcopy(_RESULT_CACHE[aircraft_id])
+    
     checker = F35SystemChecker(aircraft_id)
-    return checker.run_full_check()
+    result = checker.run_full_check()
+    
+    if use_cache:
+        _RESULT_CACHE[aircraft_id] = copy.deepcopy(result)
+        _RESULT_CACHE.move_to_end(aircraft_id)
+        while len(_RESULT_CACHE) > CHECK_CACHE_MAXSIZE:
+            _RESULT_CACHE.popitem(last=False)
+    return result
 
 
 if __name__ == "__main__":
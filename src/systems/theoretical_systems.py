@@ -12,7 +12,12 @@ import time
 import random
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional, Tuple
+
+try:
+    from ._console import BufferedOutput
+except ImportError:  # run as a script from src/systems
+    from _console import BufferedOutput
 
 
 class TheoreticalSystemStatus(Enum):
@@ -26,7 +31,7 @@ class TheoreticalSystemStatus(Enum):
     THEORETICAL = "THEORETICAL"
 
 
-@dataclass 
+@dataclass(slots=True, frozen=True)
 class TheoreticalCheckResult:
     """Result of a theoretical system check"""
     system_name: str
@@ -37,734 +42,763 @@ class TheoreticalCheckResult:
     theoretical_readiness: Optional[float] = None  # TRL level
 
 
-class AdvancedWeaponsChecker:
-    """
-    Advanced Theoretical Weapons Systems Checker
-    
-    Includes:
-    - Directed Energy Weapons (DEW)
-    - Electromagnetic Pulse (EMP) Systems
-    - Plasma-based weapons
-    - Quantum Entanglement Disruptors
-    - Graviton Beam Projectors
-    """
-    
-    def __init__(self):
-        self.results: List[TheoreticalCheckResult] = []
-        
-    def _log(self, result: TheoreticalCheckResult) -> None:
-        self.results.append(result)
-        status_symbol = "✓" if result.status in [TheoreticalSystemStatus.NOMINAL, TheoreticalSystemStatus.STANDBY] else "◈" if result.status == TheoreticalSystemStatus.THEORETICAL else "⚠"
-        power_str = f" [{result.power_draw:.1f} kW]" if result.power_draw else ""
-        print(f"  [{status_symbol}] {result.system_name}: {result.status.value}{power_str}")
-        print(f"      └─ {result.message}")
-        
-    def check_directed_energy_weapons(self) -> List[TheoreticalCheckResult]:
-        """Check Directed Energy Weapon systems"""
-        print("\n  ── DIRECTED ENERGY WEAPONS (DEW) ──")
-        
-        # High-Energy Laser (HEL)
-        result = TheoreticalCheckResult(
-            "High-Energy Laser (HEL-X1)",
-            TheoreticalSystemStatus.STANDBY,
-            "150kW fiber laser array charged and ready",
-            power_draw=150.0,
-            stability_index=98.5,
-            theoretical_readiness=7
-        )
-        self._log(result)
-        
-        # Microwave Weapon
-        result = TheoreticalCheckResult(
-            "Active Denial Microwave",
-            TheoreticalSystemStatus.STANDBY,
-            "95GHz millimeter wave emitter calibrated",
-            power_draw=50.0,
-            stability_index=99.2,
-            theoretical_readiness=8
-        )
-        self._log(result)
-        
-        return self.results
-    
-    def check_emp_systems(self) -> List[TheoreticalCheckResult]:
-        """Check EMP and electronic warfare weapons"""
-        print("\n  ── ELECTROMAGNETIC PULSE SYSTEMS ──")
-        
-        result = TheoreticalCheckResult(
-            "Focused EMP Generator",
-            TheoreticalSystemStatus.STANDBY,
-            "Explosive flux compression generator primed",
-            power_draw=0.0,  # Explosive-powered
-            stability_index=100.0,
-            theoretical_readiness=6
-        )
-        self._log(result)
-        
-        result = TheoreticalCheckResult(
-            "CHAMP Variant",
-            TheoreticalSystemStatus.NOMINAL,
-            "Counter-electronics High-power Microwave ready",
-            power_draw=85.0,
-            stability_index=97.8,
-            theoretical_readiness=8
-        )
-        self._log(result)
-        
-        return self.results
-    
-    def check_plasma_weapons(self) -> List[TheoreticalCheckResult]:
-        """Check experimental plasma-based weapons"""
-        print("\n  ── PLASMA WEAPONS SYSTEMS ──")
-        
-        result = TheoreticalCheckResult(
-            "Plasma Containment Array",
-            TheoreticalSystemStatus.CALIBRATING,
-            "Magnetic bottle stabilizing at 10^6 Kelvin",
-            power_draw=280.0,
-            stability_index=87.3,
-            theoretical_readiness=4
-        )
-        self._log(result)
-        
-        result = TheoreticalCheckResult(
-            "Plasma Bolt Accelerator",
-            TheoreticalSystemStatus.THEORETICAL,
-            "Toroidal plasma acceleration coils charging",
-            power_draw=450.0,
-            stability_index=72.1,
-            theoretical_readiness=3
-        )
-        self._log(result)
-        
-        return self.results
-    
-    def check_quantum_weapons(self) -> List[TheoreticalCheckResult]:
-        """Check quantum-based weapon systems"""
-        print("\n  ── QUANTUM WEAPONS SYSTEMS ──")
-        
-        result = TheoreticalCheckResult(
-            "Quantum Entanglement Disruptor",
-            TheoreticalSystemStatus.THEORETICAL,
-            "Decoherence field generator at 0.01K operating temp",
-            power_draw=180.0,
-            stability_index=45.2,
-            theoretical_readiness=2
-        )
-        self._log(result)
-        
-        result = TheoreticalCheckResult(
-            "Probability Wave Collapser",
-            TheoreticalSystemStatus.THEORETICAL,
-            "Schrödinger field manipulation array online",
-            power_draw=320.0,
-            stability_index=33.8,
-            theoretical_readiness=1
-        )
-        self._log(result)
-        
-        return self.results
-    
-    def check_graviton_weapons(self) -> List[TheoreticalCheckResult]:
-        """Check graviton-based weapon systems"""
-        print("\n  ── GRAVITON WEAPONS SYSTEMS ──")
-        
-        result = TheoreticalCheckResult(
-            "Graviton Beam Projector",
-            TheoreticalSystemStatus.THEORETICAL,
-            "Exotic matter containment at negative energy density",
-            power_draw=850.0,
-            stability_index=12.4,
-            theoretical_readiness=1
-        )
-        self._log(result)
-        
-        result = TheoreticalCheckResult(
-            "Localized Gravity Well Generator",
-            TheoreticalSystemStatus.THEORETICAL,
-            "Micro-singularity formation chamber pressurized",
-            power_draw=1200.0,
-            stability_index=8.7,
-            theoretical_readiness=1
-        )
-        self._log(result)
-        
-        return self.results
-    
-    def run_full_check(self) -> Dict[str, any]:
-        """Run complete advanced weapons check"""
-        print(f"\n{'='*60}")
-        print("ADVANCED THEORETICAL WEAPONS SYSTEMS CHECK")
-        print(f"{'='*60}")
-        print("WARNING: NEXUS-D SPECIAL ACCESS REQUIRED")
-        print("Classification: BEYOND TOP SECRET")
-        
-        self.check_directed_energy_weapons()
-        self.check_emp_systems()
-        self.check_plasma_weapons()
-        self.check_quantum_weapons()
-        self.check_graviton_weapons()
-        
-        return {"results": self.results, "count": len(self.results)}
+_RULE_EQ = "=" * 60
 
+# Teleportation readiness summary, printed verbatim
+_TELEPORT_BOX = "\n".join((
+    "  ┌────────────────────────────────────────────────────┐",
+    "  │  HYPER-LATTICE TELEPORTATION STATUS               │",
+    "  ├────────────────────────────────────────────────────┤",
+    "  │  Technology Readiness Level: 0 (Basic Principles) │",
+    "  │  Theoretical Feasibility: UNPROVEN                │",
+    "  │  Power Requirements: ~10^21 W (1 Zettawatt)       │",
+    "  │  Exotic Matter Required: YES (Not discovered)     │",
+    "  │  Estimated Development: 500-1000+ years           │",
+    "  │  Current Status: SCIENCE FICTION                  │",
+    "  └────────────────────────────────────────────────────┘",
+))
 
-class PhaseShiftingChecker:
-    """
-    Phase Shifting Technology Checker
-    
-    Based on theoretical quantum phase manipulation allowing
-    matter to exist in shifted phase states relative to normal space-time.
-    
-    Technologies:
-    - Quantum Phase Oscillator
-    - Dimensional Membrane Shifter
-    - Phase Coherence Field Generator
-    """
-    
-    def __init__(self):
-        self.results: List[TheoreticalCheckResult] = []
-        
-    def _log(self, result: TheoreticalCheckResult) -> None:
-        self.results.append(result)
-        status_symbol = "◈" if result.status == TheoreticalSystemStatus.THEORETICAL else "✓" if result.status == TheoreticalSystemStatus.NOMINAL else "⚠"
-        print(f"  [{status_symbol}] {result.system_name}: {result.status.value}")
-        print(f"      └─ {result.message}")
-        if result.stability_index:
-            print(f"      └─ Phase Stability: {result.stability_index:.1f}%")
-    
-    def run_check(self) -> Dict[str, any]:
-        """Run phase shifting systems check"""
-        print(f"\n{'='*60}")
-        print("PHASE SHIFTING TECHNOLOGY CHECK")
-        print(f"{'='*60}")
-        print("STATUS: EXPERIMENTAL / TRL 1-2")
-        
-        print("\n  ── QUANTUM PHASE OSCILLATOR ──")
-        result = TheoreticalCheckResult(
+
+# Power requirement display for power_draw (kW), largest unit first:
+# (threshold, scale, format)
+_POWER_UNITS = (
+    (1e12, 1e12, "      └─ Power Requirement: {:.2f} TW (EXCEEDS AIRCRAFT CAPACITY)"),
+    (1e9, 1e9, "      └─ Power Requirement: {:.2f} GW (EXCEEDS AIRCRAFT CAPACITY)"),
+    (1e6, 1e6, "      └─ Power Requirement: {:.2f} MW"),
+    (0, 1, "      └─ Power Requirement: {:.0f} kW"),
+)
+
+# Fixed check results, built once at import and logged in this order
+
+# Advanced weapons, one tuple per check group
+_DEW_RESULTS = (
+    TheoreticalCheckResult(
+        "High-Energy Laser (HEL-X1)",
+        TheoreticalSystemStatus.STANDBY,
+        "150kW fiber laser array charged and ready",
+        power_draw=150.0,
+        stability_index=98.5,
+        theoretical_readiness=7
+    ),
+    TheoreticalCheckResult(
+        "Active Denial Microwave",
+        TheoreticalSystemStatus.STANDBY,
+        "95GHz millimeter wave emitter calibrated",
+        power_draw=50.0,
+        stability_index=99.2,
+        theoretical_readiness=8
+    ),
+)
+
+_EMP_RESULTS = (
+    TheoreticalCheckResult(
+        "Focused EMP Generator",
+        TheoreticalSystemStatus.STANDBY,
+        "Explosive flux compression generator primed",
+        power_draw=0.0,  # Explosive-powered
+        stability_index=100.0,
+        theoretical_readiness=6
+    ),
+    TheoreticalCheckResult(
+        "CHAMP Variant",
+        TheoreticalSystemStatus.NOMINAL,
+        "Counter-electronics High-power Microwave ready",
+        power_draw=85.0,
+        stability_index=97.8,
+        theoretical_readiness=8
+    ),
+)
+
+_PLASMA_RESULTS = (
+    TheoreticalCheckResult(
+        "Plasma Containment Array",
+        TheoreticalSystemStatus.CALIBRATING,
+        "Magnetic bottle stabilizing at 10^6 Kelvin",
+        power_draw=280.0,
+        stability_index=87.3,
+        theoretical_readiness=4
+    ),
+    TheoreticalCheckResult(
+        "Plasma Bolt Accelerator",
+        TheoreticalSystemStatus.THEORETICAL,
+        "Toroidal plasma acceleration coils charging",
+        power_draw=450.0,
+        stability_index=72.1,
+        theoretical_readiness=3
+    ),
+)
+
+_QUANTUM_RESULTS = (
+    TheoreticalCheckResult(
+        "Quantum Entanglement Disruptor",
+        TheoreticalSystemStatus.THEORETICAL,
+        "Decoherence field generator at 0.01K operating temp",
+        power_draw=180.0,
+        stability_index=45.2,
+        theoretical_readiness=2
+    ),
+    TheoreticalCheckResult(
+        "Probability Wave Collapser",
+        TheoreticalSystemStatus.THEORETICAL,
+        "Schrödinger field manipulation array online",
+        power_draw=320.0,
+        stability_index=33.8,
+        theoretical_readiness=1
+    ),
+)
+
+_GRAVITON_RESULTS = (
+    TheoreticalCheckResult(
+        "Graviton Beam Projector",
+        TheoreticalSystemStatus.THEORETICAL,
+        "Exotic matter containment at negative energy density",
+        power_draw=850.0,
+        stability_index=12.4,
+        theoretical_readiness=1
+    ),
+    TheoreticalCheckResult(
+        "Localized Gravity Well Generator",
+        TheoreticalSystemStatus.THEORETICAL,
+        "Micro-singularity formation chamber pressurized",
+        power_draw=1200.0,
+        stability_index=8.7,
+        theoretical_readiness=1
+    ),
+)
+
+# Phase shifting, as (section title, results) pairs
+_PHASE_SECTIONS = (
+    ("QUANTUM PHASE OSCILLATOR", (
+        TheoreticalCheckResult(
             "Phase Oscillator Core",
             TheoreticalSystemStatus.THEORETICAL,
             "Planck-scale vibration harmonics at 10^43 Hz",
             power_draw=2500.0,
             stability_index=23.4,
             theoretical_readiness=1
-        )
-        self._log(result)
-        
-        result = TheoreticalCheckResult(
+        ),
+        TheoreticalCheckResult(
             "Temporal Phase Lock",
             TheoreticalSystemStatus.THEORETICAL,
             "Chronon field synchronization nominal",
             power_draw=800.0,
             stability_index=31.2,
             theoretical_readiness=1
-        )
-        self._log(result)
-        
-        print("\n  ── DIMENSIONAL MEMBRANE INTERFACE ──")
-        result = TheoreticalCheckResult(
+        ),
+    )),
+    ("DIMENSIONAL MEMBRANE INTERFACE", (
+        TheoreticalCheckResult(
             "Brane Detector Array",
             TheoreticalSystemStatus.CALIBRATING,
             "11-dimensional M-theory sensors calibrating",
             power_draw=150.0,
             stability_index=67.8,
             theoretical_readiness=2
-        )
-        self._log(result)
-        
-        result = TheoreticalCheckResult(
+        ),
+        TheoreticalCheckResult(
             "Membrane Phasing Coils",
             TheoreticalSystemStatus.THEORETICAL,
             "Calabi-Yau manifold resonance detected",
             power_draw=3200.0,
             stability_index=15.3,
             theoretical_readiness=1
-        )
-        self._log(result)
-        
-        print("\n  ── PHASE COHERENCE FIELD ──")
-        result = TheoreticalCheckResult(
+        ),
+    )),
+    ("PHASE COHERENCE FIELD", (
+        TheoreticalCheckResult(
             "Coherence Field Generator",
             TheoreticalSystemStatus.THEORETICAL,
             "Maintaining quantum superposition across macro scale",
             power_draw=1800.0,
             stability_index=19.7,
             theoretical_readiness=1
-        )
-        self._log(result)
-        
-        result = TheoreticalCheckResult(
+        ),
+        TheoreticalCheckResult(
             "Decoherence Suppressor",
             TheoreticalSystemStatus.THEORETICAL,
             "Environmental isolation at 10^-15 interaction rate",
             power_draw=450.0,
             stability_index=42.1,
             theoretical_readiness=2
-        )
-        self._log(result)
-        
-        # Phase shift readiness assessment
-        print("\n  ── PHASE SHIFT READINESS ──")
-        avg_stability = sum(r.stability_index for r in self.results if r.stability_index) / len(self.results)
-        print(f"  Average Phase Stability: {avg_stability:.1f}%")
-        print(f"  Phase Shift Capability: {'THEORETICAL ONLY' if avg_stability < 50 else 'EXPERIMENTAL'}")
-        print(f"  Estimated TRL: 1-2")
-        
-        return {"results": self.results, "avg_stability": avg_stability}
-
+        ),
+    )),
+)
 
-class CloakingSystemChecker:
-    """
-    Advanced Cloaking Systems Checker
-    
-    Multi-spectrum invisibility and signature reduction technologies:
-    - Adaptive Metamaterial Cloaking
-    - Plasma Stealth Field
-    - Optical Camouflage Array
-    - Thermal Signature Nullification
-    - Radar Absorption/Cancellation
-    - Gravitational Lensing Cloak (Theoretical)
-    """
-    
-    def __init__(self):
-        self.results: List[TheoreticalCheckResult] = []
-        
-    def _log(self, result: TheoreticalCheckResult) -> None:
-        self.results.append(result)
-        status_symbol = "◈" if result.status == TheoreticalSystemStatus.THEORETICAL else "✓" if result.status in [TheoreticalSystemStatus.NOMINAL, TheoreticalSystemStatus.ACTIVE] else "⚠"
-        print(f"  [{status_symbol}] {result.system_name}: {result.status.value}")
-        print(f"      └─ {result.message}")
-    
-    def run_check(self) -> Dict[str, any]:
-        """Run cloaking systems check"""
-        print(f"\n{'='*60}")
-        print("ADVANCED CLOAKING SYSTEMS CHECK")
-        print(f"{'='*60}")
-        print("MULTI-SPECTRUM SIGNATURE MANAGEMENT")
-        
-        print("\n  ── METAMATERIAL CLOAKING ──")
-        result = TheoreticalCheckResult(
+# Cloaking
+_CLOAKING_SECTIONS = (
+    ("METAMATERIAL CLOAKING", (
+        TheoreticalCheckResult(
             "Adaptive Metasurface Array",
             TheoreticalSystemStatus.NOMINAL,
             "Programmable EM response tiles: 98.7% coverage",
             power_draw=85.0,
             stability_index=94.2,
             theoretical_readiness=5
-        )
-        self._log(result)
-        
-        result = TheoreticalCheckResult(
+        ),
+        TheoreticalCheckResult(
             "Negative Refractive Index Layer",
             TheoreticalSystemStatus.STANDBY,
             "Light-bending metamaterial at n=-1.0 ready",
             power_draw=120.0,
             stability_index=89.1,
             theoretical_readiness=4
-        )
-        self._log(result)
-        
-        print("\n  ── PLASMA STEALTH FIELD ──")
-        result = TheoreticalCheckResult(
+        ),
+    )),
+    ("PLASMA STEALTH FIELD", (
+        TheoreticalCheckResult(
             "Ionization Field Generator",
             TheoreticalSystemStatus.STANDBY,
             "Cold plasma envelope generator primed",
             power_draw=200.0,
             stability_index=78.5,
             theoretical_readiness=4
-        )
-        self._log(result)
-        
-        result = TheoreticalCheckResult(
+        ),
+        TheoreticalCheckResult(
             "Radar Absorption Plasma",
             TheoreticalSystemStatus.STANDBY,
             "Plasma frequency tuned to 1-40 GHz absorption",
             power_draw=180.0,
             stability_index=82.3,
             theoretical_readiness=4
-        )
-        self._log(result)
-        
-        print("\n  ── OPTICAL CAMOUFLAGE ──")
-        result = TheoreticalCheckResult(
+        ),
+    )),
+    ("OPTICAL CAMOUFLAGE", (
+        TheoreticalCheckResult(
             "Electrochromic Skin",
             TheoreticalSystemStatus.NOMINAL,
             "Adaptive visual camouflage: 16.7M color range",
             power_draw=45.0,
             stability_index=96.8,
             theoretical_readiness=6
-        )
-        self._log(result)
-        
-        result = TheoreticalCheckResult(
+        ),
+        TheoreticalCheckResult(
             "Active Light Cancellation",
             TheoreticalSystemStatus.CALIBRATING,
             "Counter-illumination LEDs synchronized",
             power_draw=60.0,
             stability_index=91.2,
             theoretical_readiness=5
-        )
-        self._log(result)
-        
-        print("\n  ── THERMAL SIGNATURE CONTROL ──")
-        result = TheoreticalCheckResult(
+        ),
+    )),
+    ("THERMAL SIGNATURE CONTROL", (
+        TheoreticalCheckResult(
             "IR Signature Suppressor",
             TheoreticalSystemStatus.NOMINAL,
             "Exhaust mixing and cooling system active",
             power_draw=25.0,
             stability_index=97.5,
             theoretical_readiness=8
-        )
-        self._log(result)
-        
-        result = TheoreticalCheckResult(
+        ),
+        TheoreticalCheckResult(
             "Thermal Redistribution Grid",
             TheoreticalSystemStatus.NOMINAL,
             "Heat pipe network: ΔT < 5°C across skin",
             power_draw=15.0,
             stability_index=98.2,
             theoretical_readiness=7
-        )
-        self._log(result)
-        
-        print("\n  ── GRAVITATIONAL LENSING CLOAK ──")
-        result = TheoreticalCheckResult(
+        ),
+    )),
+    ("GRAVITATIONAL LENSING CLOAK", (
+        TheoreticalCheckResult(
             "Gravity Lens Array",
             TheoreticalSystemStatus.THEORETICAL,
             "Space-time curvature manipulation pending",
             power_draw=5000.0,
             stability_index=5.2,
             theoretical_readiness=1
-        )
-        self._log(result)
-        
-        result = TheoreticalCheckResult(
+        ),
+        TheoreticalCheckResult(
             "Photon Path Deflector",
             TheoreticalSystemStatus.THEORETICAL,
             "Light trajectory bending via exotic matter",
             power_draw=8500.0,
             stability_index=3.1,
             theoretical_readiness=1
-        )
-        self._log(result)
-        
-        # Cloaking effectiveness summary
-        print("\n  ── CLOAKING EFFECTIVENESS ──")
-        operational = [r for r in self.results if r.status in [TheoreticalSystemStatus.NOMINAL, TheoreticalSystemStatus.STANDBY, TheoreticalSystemStatus.ACTIVE]]
-        print(f"  Operational Systems: {len(operational)}/{len(self.results)}")
-        print(f"  Radar Cross Section: -45 dBsm (with plasma)")
-        print(f"  IR Signature: 85% reduction")
-        print(f"  Visual Detection: 70% reduction (daylight)")
-        print(f"  Full Invisibility: THEORETICAL ONLY")
-        
-        return {"results": self.results, "operational_count": len(operational)}
-
+        ),
+    )),
+)
 
-class HyperLatticeTeleportationChecker:
-    """
-    Hyper-Lattice Collapse Teleportation System Checker
-    
-    Based on theoretical physics involving:
-    - Quantum Entanglement Networks
-    - Space-time Lattice Manipulation
-    - Wormhole Stabilization
-    - Einstein-Rosen Bridge Generation
-    - Alcubierre Metric Compression
-    
-    WARNING: PURELY THEORETICAL - Requires negative energy/exotic matter
-    """
-    
-    def __init__(self):
-        self.results: List[TheoreticalCheckResult] = []
-        
-    def _log(self, result: TheoreticalCheckResult) -> None:
-        self.results.append(result)
-        status_symbol = "◈"  # All theoretical
-        print(f"  [{status_symbol}] {result.system_name}: {result.status.value}")
-        print(f"      └─ {result.message}")
-        if result.power_draw:
-            if result.power_draw >= 1e12:
-                print(f"      └─ Power Requirement: {result.power_draw/1e12:.2f} TW (EXCEEDS AIRCRAFT CAPACITY)")
-            elif result.power_draw >= 1e9:
-                print(f"      └─ Power Requirement: {result.power_draw/1e9:.2f} GW (EXCEEDS AIRCRAFT CAPACITY)")
-            elif result.power_draw >= 1e6:
-                print(f"      └─ Power Requirement: {result.power_draw/1e6:.2f} MW")
-            else:
-                print(f"      └─ Power Requirement: {result.power_draw:.0f} kW")
-    
-    def run_check(self) -> Dict[str, any]:
-        """Run hyper-lattice teleportation systems check"""
-        print(f"\n{'='*60}")
-        print("HYPER-LATTICE TELEPORTATION SYSTEM CHECK")
-        print(f"{'='*60}")
-        print("⚠ WARNING: ALL SYSTEMS THEORETICAL - TRL 0-1")
-        print("⚠ REQUIRES: Exotic matter / Negative energy density")
-        print("⚠ STATUS: Beyond current physics understanding")
-        
-        print("\n  ── QUANTUM ENTANGLEMENT MATRIX ──")
-        result = TheoreticalCheckResult(
+# Hyper-lattice teleportation
+_TELEPORT_SECTIONS = (
+    ("QUANTUM ENTANGLEMENT MATRIX", (
+        TheoreticalCheckResult(
             "Entanglement Generator",
             TheoreticalSystemStatus.THEORETICAL,
             "Creating Bell pairs at 10^12 qubits/sec",
             power_draw=500.0,
             stability_index=45.0,
             theoretical_readiness=2
-        )
-        self._log(result)
-        
-        result = TheoreticalCheckResult(
+        ),
+        TheoreticalCheckResult(
             "Quantum State Teleporter",
             TheoreticalSystemStatus.THEORETICAL,
             "Quantum information transfer channel open",
             power_draw=200.0,
             stability_index=38.2,
             theoretical_readiness=2
-        )
-        self._log(result)
-        
-        print("\n  ── SPACE-TIME LATTICE MANIPULATOR ──")
-        result = TheoreticalCheckResult(
+        ),
+    )),
+    ("SPACE-TIME LATTICE MANIPULATOR", (
+        TheoreticalCheckResult(
             "Lattice Distortion Field",
             TheoreticalSystemStatus.THEORETICAL,
             "Planck-scale geometry manipulation initializing",
             power_draw=1e9,  # 1 GW
             stability_index=8.5,
             theoretical_readiness=1
-        )
-        self._log(result)
-        
-        result = TheoreticalCheckResult(
+        ),
+        TheoreticalCheckResult(
             "Casimir Effect Amplifier",
             TheoreticalSystemStatus.THEORETICAL,
             "Negative energy density: -10^-9 J/m³",
             power_draw=5e6,  # 5 MW
             stability_index=12.3,
             theoretical_readiness=1
-        )
-        self._log(result)
-        
-        print("\n  ── EINSTEIN-ROSEN BRIDGE GENERATOR ──")
-        result = TheoreticalCheckResult(
+        ),
+    )),
+    ("EINSTEIN-ROSEN BRIDGE GENERATOR", (
+        TheoreticalCheckResult(
             "Wormhole Initiator",
             TheoreticalSystemStatus.THEORETICAL,
             "Schwarzschild throat radius: 10^-35 m",
             power_draw=1e15,  # 1 PW (Petawatt)
             stability_index=0.01,
             theoretical_readiness=0
-        )
-        self._log(result)
-        
-        result = TheoreticalCheckResult(
+        ),
+        TheoreticalCheckResult(
             "Exotic Matter Containment",
             TheoreticalSystemStatus.OFFLINE,
             "ERROR: Exotic matter not detected in universe",
             power_draw=None,
             stability_index=0.0,
             theoretical_readiness=0
-        )
-        self._log(result)
-        
-        result = TheoreticalCheckResult(
+        ),
+        TheoreticalCheckResult(
             "Traversable Wormhole Stabilizer",
             TheoreticalSystemStatus.THEORETICAL,
             "Requires mass equivalent to Jupiter",
             power_draw=1e18,  # 1 EW (Exawatt)
             stability_index=0.001,
             theoretical_readiness=0
-        )
-        self._log(result)
-        
-        print("\n  ── ALCUBIERRE WARP FIELD ──")
-        result = TheoreticalCheckResult(
+        ),
+    )),
+    ("ALCUBIERRE WARP FIELD", (
+        TheoreticalCheckResult(
             "Warp Bubble Generator",
             TheoreticalSystemStatus.THEORETICAL,
             "Space-time metric compression field",
             power_draw=1e20,  # 100 EW
             stability_index=0.0001,
             theoretical_readiness=0
-        )
-        self._log(result)
-        
-        result = TheoreticalCheckResult(
+        ),
+        TheoreticalCheckResult(
             "Negative Energy Shell",
             TheoreticalSystemStatus.THEORETICAL,
             "Casimir vacuum energy extraction pending",
             power_draw=1e19,
             stability_index=0.00001,
             theoretical_readiness=0
-        )
-        self._log(result)
-        
-        print("\n  ── HYPER-LATTICE COLLAPSE ENGINE ──")
-        result = TheoreticalCheckResult(
+        ),
+    )),
+    ("HYPER-LATTICE COLLAPSE ENGINE", (
+        TheoreticalCheckResult(
             "Lattice Collapse Initiator",
             TheoreticalSystemStatus.THEORETICAL,
             "Folding space-time via controlled singularity",
             power_draw=1e21,  # 1 ZW (Zettawatt)
             stability_index=0.000001,
             theoretical_readiness=0
-        )
-        self._log(result)
-        
-        result = TheoreticalCheckResult(
+        ),
+        TheoreticalCheckResult(
             "Destination Lock Computer",
             TheoreticalSystemStatus.THEORETICAL,
             "11-dimensional coordinate system ready",
             power_draw=1000.0,
             stability_index=15.0,
             theoretical_readiness=1
-        )
-        self._log(result)
-        
-        result = TheoreticalCheckResult(
+        ),
+        TheoreticalCheckResult(
             "Matter Reintegration Buffer",
             TheoreticalSystemStatus.THEORETICAL,
             "Quantum state preservation at destination",
             power_draw=5000.0,
             stability_index=22.5,
             theoretical_readiness=1
-        )
-        self._log(result)
-        
-        # Teleportation readiness assessment
-        print("\n  ── TELEPORTATION READINESS ASSESSMENT ──")
-        print("  ┌────────────────────────────────────────────────────┐")
-        print("  │  HYPER-LATTICE TELEPORTATION STATUS               │")
-        print("  ├────────────────────────────────────────────────────┤")
-        print("  │  Technology Readiness Level: 0 (Basic Principles) │")
-        print("  │  Theoretical Feasibility: UNPROVEN                │")
-        print("  │  Power Requirements: ~10^21 W (1 Zettawatt)       │")
-        print("  │  Exotic Matter Required: YES (Not discovered)     │")
-        print("  │  Estimated Development: 500-1000+ years           │")
-        print("  │  Current Status: SCIENCE FICTION                  │")
-        print("  └────────────────────────────────────────────────────┘")
-        print("\n  ⚠ RECOMMENDATION: Focus on conventional propulsion")
-        print("  ⚠ ALTERNATIVE: Research quantum tunneling for nano-scale")
-        
-        return {
-            "results": self.results,
-            "feasibility": "THEORETICAL ONLY",
-            "trl": 0,
-            "exotic_matter_required": True
-        }
+        ),
+    )),
+)
 
-
-class AdvancedPropulsionChecker:
-    """
-    Advanced Propulsion Systems Checker
-    
-    Includes emerging and theoretical propulsion:
-    - Rotating Detonation Engine
-    - Ion/Plasma Propulsion
-    - Magnetohydrodynamic Drive
-    - EmDrive (Controversial)
-    - Antimatter Propulsion
-    """
-    
-    def __init__(self):
-        self.results: List[TheoreticalCheckResult] = []
-        
-    def _log(self, result: TheoreticalCheckResult) -> None:
-        self.results.append(result)
-        status_symbol = "◈" if result.status == TheoreticalSystemStatus.THEORETICAL else "✓" if result.status == TheoreticalSystemStatus.NOMINAL else "⚠"
-        print(f"  [{status_symbol}] {result.system_name}: {result.status.value}")
-        print(f"      └─ {result.message}")
-    
-    def run_check(self) -> Dict[str, any]:
-        """Run advanced propulsion systems check"""
-        print(f"\n{'='*60}")
-        print("ADVANCED PROPULSION SYSTEMS CHECK")
-        print(f"{'='*60}")
-        
-        print("\n  ── ROTATING DETONATION ENGINE ──")
-        result = TheoreticalCheckResult(
+# Advanced propulsion
+_PROPULSION_SECTIONS = (
+    ("ROTATING DETONATION ENGINE", (
+        TheoreticalCheckResult(
             "RDE Core",
             TheoreticalSystemStatus.STANDBY,
             "Continuous detonation wave stable at 20 kHz",
             power_draw=0,  # Produces power
             stability_index=78.5,
             theoretical_readiness=5
-        )
-        self._log(result)
-        
-        print("\n  ── ION PROPULSION ARRAY ──")
-        result = TheoreticalCheckResult(
+        ),
+    )),
+    ("ION PROPULSION ARRAY", (
+        TheoreticalCheckResult(
             "Hall Effect Thrusters",
             TheoreticalSystemStatus.STANDBY,
             "Xenon ion acceleration to 30 km/s",
             power_draw=50.0,
             stability_index=95.2,
             theoretical_readiness=9
-        )
-        self._log(result)
-        
-        print("\n  ── MAGNETOHYDRODYNAMIC DRIVE ──")
-        result = TheoreticalCheckResult(
+        ),
+    )),
+    ("MAGNETOHYDRODYNAMIC DRIVE", (
+        TheoreticalCheckResult(
             "MHD Accelerator",
             TheoreticalSystemStatus.THEORETICAL,
             "Plasma channel acceleration system",
             power_draw=500.0,
             stability_index=45.0,
             theoretical_readiness=3
-        )
-        self._log(result)
-        
-        print("\n  ── ANTIMATTER PROPULSION ──")
-        result = TheoreticalCheckResult(
+        ),
+    )),
+    ("ANTIMATTER PROPULSION", (
+        TheoreticalCheckResult(
             "Antimatter Containment",
             TheoreticalSystemStatus.THEORETICAL,
             "Penning trap: 10^6 antiprotons contained",
             power_draw=100.0,
             stability_index=25.0,
             theoretical_readiness=2
-        )
-        self._log(result)
-        
-        result = TheoreticalCheckResult(
+        ),
+        TheoreticalCheckResult(
             "Annihilation Chamber",
             TheoreticalSystemStatus.THEORETICAL,
             "Matter-antimatter reaction: E=mc² direct conversion",
             power_draw=50.0,
             stability_index=15.0,
             theoretical_readiness=1
-        )
-        self._log(result)
+        ),
+    )),
+)
+
+
+class _BaseChecker(BufferedOutput):
+    """Result log and buffered console output shared by the theoretical checkers"""
+    
+    # Log symbol per status; anything else is flagged "⚠"
+    _SYMBOLS: Dict[TheoreticalSystemStatus, str] = {}
+    
+    def __init__(self):
+        self.results: List[TheoreticalCheckResult] = []
+        self._out: List[str] = []
         
-        return {"results": self.results}
+    def _suffix(self, result: TheoreticalCheckResult) -> str:
+        """Extra text appended to a result's status line"""
+        return ""
+        
+    def _log(self, result: TheoreticalCheckResult) -> None:
+        self.results.append(result)
+        status_symbol = self._SYMBOLS.get(result.status, "⚠")
+        self._emit(f"  [{status_symbol}] {result.system_name}: {result.status.value}{self._suffix(result)}")
+        self._emit(f"      └─ {result.message}")
 
 
-def run_all_theoretical_checks() -> Dict[str, any]:
+class AdvancedWeaponsChecker(_BaseChecker):
     """
-    Run all theoretical and advanced system checks
+    Advanced Theoretical Weapons Systems Checker
     
-    Returns comprehensive status of all advanced systems
+    Includes:
+    - Directed Energy Weapons (DEW)
+    - Electromagnetic Pulse (EMP) Systems
+    - Plasma-based weapons
+    - Quantum Entanglement Disruptors
+    - Graviton Beam Projectors
+    """
+    
+    _SYMBOLS = {
+        TheoreticalSystemStatus.NOMINAL: "✓",
+        TheoreticalSystemStatus.STANDBY: "✓",
+        TheoreticalSystemStatus.THEORETICAL: "◈",
+    }
+    
+    def _suffix(self, result: TheoreticalCheckResult) -> str:
+        """Power draw in kW, when the system draws any"""
+        return f" [{result.power_draw:.1f} kW]" if result.power_draw else ""
+        
+    def check_directed_energy_weapons(self) -> List[TheoreticalCheckResult]:
+        """Check Directed Energy Weapon systems"""
+        self._emit("\n  ── DIRECTED ENERGY WEAPONS (DEW) ──")
+        
+        start = len(self.results)
+        for result in _DEW_RESULTS:
+            self._log(result)
+        
+        self._flush()
+        return self.results[start:]
+    
+    def check_emp_systems(self) -> List[TheoreticalCheckResult]:
+        """Check EMP and electronic warfare weapons"""
+        self._emit("\n  ── ELECTROMAGNETIC PULSE SYSTEMS ──")
+        
+        start = len(self.results)
+        for result in _EMP_RESULTS:
+            self._log(result)
+        
+        self._flush()
+        return self.results[start:]
+    
+    def check_plasma_weapons(self) -> List[TheoreticalCheckResult]:
+        """Check experimental plasma-based weapons"""
+        self._emit("\n  ── PLASMA WEAPONS SYSTEMS ──")
+        
+        start = len(self.results)
+        for result in _PLASMA_RESULTS:
+            self._log(result)
+        
+        self._flush()
+        return self.results[start:]
+    
+    def check_quantum_weapons(self) -> List[TheoreticalCheckResult]:
+        """Check quantum-based weapon systems"""
+        self._emit("\n  ── QUANTUM WEAPONS SYSTEMS ──")
+        
+        start = len(self.results)
+        for result in _QUANTUM_RESULTS:
+            self._log(result)
+        
+        self._flush()
+        return self.results[start:]
+    
+    def check_graviton_weapons(self) -> List[TheoreticalCheckResult]:
+        """Check graviton-based weapon systems"""
+        self._emit("\n  ── GRAVITON WEAPONS SYSTEMS ──")
+        
+        start = len(self.results)
+        for result in _GRAVITON_RESULTS:
+            self._log(result)
+        
+        self._flush()
+        return self.results[start:]
+    
+    def run_full_check(self) -> Dict[str, any]:
+        """Run complete advanced weapons check"""
+        self._emit(f"\n{_RULE_EQ}\nADVANCED THEORETICAL WEAPONS SYSTEMS CHECK\n{_RULE_EQ}")
+        self._emit("WARNING: NEXUS-D SPECIAL ACCESS REQUIRED")
+        self._emit("Classification: BEYOND TOP SECRET")
+        
+        self.check_directed_energy_weapons()
+        self.check_emp_systems()
+        self.check_plasma_weapons()
+        self.check_quantum_weapons()
+        self.check_graviton_weapons()
+        
+        self._flush()
+        return {"results": self.results, "count": len(self.results)}
+
+
+class PhaseShiftingChecker(_BaseChecker):
+    """
+    Phase Shifting Technology Checker
+    
+    Based on theoretical quantum phase manipulation allowing
+    matter to exist in shifted phase states relative to normal space-time.
+    
+    Technologies:
+    - Quantum Phase Oscillator
+    - Dimensional Membrane Shifter
+    - Phase Coherence Field Generator
     """
-    all_results = {}
     
-    # Advanced Weapons
-    weapons_checker = AdvancedWeaponsChecker()
-    all_results["weapons"] = weapons_checker.run_full_check()
-    time.sleep(0.3)
+    _SYMBOLS = {
+        TheoreticalSystemStatus.THEORETICAL: "◈",
+        TheoreticalSystemStatus.NOMINAL: "✓",
+    }
     
-    # Phase Shifting
-    phase_checker = PhaseShiftingChecker()
-    all_results["phase_shifting"] = phase_checker.run_check()
-    time.sleep(0.3)
+    def _log(self, result: TheoreticalCheckResult) -> None:
+        super()._log(result)
+        if result.stability_index:
+            self._emit(f"      └─ Phase Stability: {result.stability_index:.1f}%")
     
-    # Cloaking
-    cloak_checker = CloakingSystemChecker()
-    all_results["cloaking"] = cloak_checker.run_check()
-    time.sleep(0.3)
+    def run_check(self) -> Dict[str, any]:
+        """Run phase shifting systems check"""
+        self._emit(f"\n{_RULE_EQ}\nPHASE SHIFTING TECHNOLOGY CHECK\n{_RULE_EQ}")
+        self._emit("STATUS: EXPERIMENTAL / TRL 1-2")
+        
+        for title, results in _PHASE_SECTIONS:
+            self._emit(f"\n  ── {title} ──")
+            for result in results:
+                self._log(result)
+        
+        # Phase shift readiness assessment
+        self._emit("\n  ── PHASE SHIFT READINESS ──")
+        total = 0.0
+        for result in self.results:
+            if result.stability_index:
+                total += result.stability_index
+        avg_stability = total / len(self.results)
+        self._emit(f"  Average Phase Stability: {avg_stability:.1f}%")
+        self._emit(f"  Phase Shift Capability: {'THEORETICAL ONLY' if avg_stability < 50 else 'EXPERIMENTAL'}")
+        self._emit(f"  Estimated TRL: 1-2")
+        
+        self._flush()
+        return {"results": self.results, "avg_stability": avg_stability}
+
+
+class CloakingSystemChecker(_BaseChecker):
+    """
+    Advanced Cloaking Systems Checker
     
-    # Teleportation
-    teleport_checker = HyperLatticeTeleportationChecker()
-    all_results["teleportation"] = teleport_checker.run_check()
-    time.sleep(0.3)
+    Multi-spectrum invisibility and signature reduction technologies:
+    - Adaptive Metamaterial Cloaking
+    - Plasma Stealth Field
+    - Optical Camouflage Array
+    - Thermal Signature Nullification
+    - Radar Absorption/Cancellation
+    - Gravitational Lensing Cloak (Theoretical)
+    """
+    
+    _SYMBOLS = {
+        TheoreticalSystemStatus.THEORETICAL: "◈",
+        TheoreticalSystemStatus.NOMINAL: "✓",
+        TheoreticalSystemStatus.ACTIVE: "✓",
+    }
+    
+    def run_check(self) -> Dict[str, any]:
+        """Run cloaking systems check"""
+        self._emit(f"\n{_RULE_EQ}\nADVANCED CLOAKING SYSTEMS CHECK\n{_RULE_EQ}")
+        self._emit("MULTI-SPECTRUM SIGNATURE MANAGEMENT")
+        
+        for title, results in _CLOAKING_SECTIONS:
+            self._emit(f"\n  ── {title} ──")
+            for result in results:
+                self._log(result)
+        
+        # Cloaking effectiveness summary
+        self._emit("\n  ── CLOAKING EFFECTIVENESS ──")
+        operational = [r for r in self.results if r.status in [TheoreticalSystemStatus.NOMINAL, TheoreticalSystemStatus.STANDBY, TheoreticalSystemStatus.ACTIVE]]
+        self._emit(f"  Operational Systems: {len(operational)}/{len(self.results)}")
+        self._emit(f"  Radar Cross Section: -45 dBsm (with plasma)")
+        self._emit(f"  IR Signature: 85% reduction")
+        self._emit(f"  Visual Detection: 70% reduction (daylight)")
+        self._emit(f"  Full Invisibility: THEORETICAL ONLY")
+        
+        self._flush()
+        return {"results": self.results, "operational_count": len(operational)}
+
+
+class HyperLatticeTeleportationChecker(_BaseChecker):
+    """
+    Hyper-Lattice Collapse Teleportation System Checker
+    
+    Based on theoretical physics involving:
+    - Quantum Entanglement Networks
+    - Space-time Lattice Manipulation
+    - Wormhole Stabilization
+    - Einstein-Rosen Bridge Generation
+    - Alcubierre Metric Compression
+    
+    WARNING: PURELY THEORETICAL - Requires negative energy/exotic matter
+    """
     
-    # Advanced Propulsion
-    propulsion_checker = AdvancedPropulsionChecker()
-    all_results["propulsion"] = propulsion_checker.run_check()
+    # All theoretical
+    _SYMBOLS = dict.fromkeys(TheoreticalSystemStatus, "◈")
     
-    return all_results
+    def _log(self, result: TheoreticalCheckResult) -> None:
+        super()._log(result)
+        if result.power_draw:
+            for threshold, scale, fmt in _POWER_UNITS:
+                if result.power_draw >= threshold:
+                    self._emit(fmt.format(result.power_draw / scale))
+                    break
+    
+    def run_check(self) -> Dict[str, any]:
+        """Run hyper-lattice teleportation systems check"""
+        self._emit(f"\n{_RULE_EQ}\nHYPER-LATTICE TELEPORTATION SYSTEM CHECK\n{_RULE_EQ}")
+        self._emit("⚠ WARNING: ALL SYSTEMS THEORETICAL - TRL 0-1")
+        self._emit("⚠ REQUIRES: Exotic matter / Negative energy density")
+        self._emit("⚠ STATUS: Beyond current physics understanding")
+        
+        for title, results in _TELEPORT_SECTIONS:
+            self._emit(f"\n  ── {title} ──")
+            for result in results:
+                self._log(result)
+        
+        # Teleportation readiness assessment
+        self._emit("\n  ── TELEPORTATION READINESS ASSESSMENT ──")
+        self._emit(_TELEPORT_BOX)
+        self._emit("\n  ⚠ RECOMMENDATION: Focus on conventional propulsion")
+        self._emit("  ⚠ ALTERNATIVE: Research quantum tunneling for nano-scale")
+        
+        self._flush()
+        return {
+            "results": self.results,
+            "feasibility": "THEORETICAL ONLY",
+            "trl": 0,
+            "exotic_matter_required": True
+        }
+
+
+class AdvancedPropulsionChecker(_BaseChecker):
+    """
+    Advanced Propulsion Systems Checker
+    
+    Includes emerging and theoretical propulsion:
+    - Rotating Detonation Engine
+    - Ion/Plasma Propulsion
+    - Magnetohydrodynamic Drive
+    - EmDrive (Controversial)
+    - Antimatter Propulsion
+    """
+    
+    _SYMBOLS = {
+        TheoreticalSystemStatus.THEORETICAL: "◈",
+        TheoreticalSystemStatus.NOMINAL: "✓",
+    }
+    
+    def run_check(self) -> Dict[str, any]:
+        """Run advanced propulsion systems check"""
+        self._emit(f"\n{_RULE_EQ}\nADVANCED PROPULSION SYSTEMS CHECK\n{_RULE_EQ}")
+        
+        for title, results in _PROPULSION_SECTIONS:
+            self._emit(f"\n  ── {title} ──")
+            for result in results:
+                self._log(result)
+        
+        self._flush()
+        return {"results": self.results}
+
+
+def iter_theoretical_checks(pacing: float = 0.0) -> Iterator[Tuple[str, Dict[str, any]]]:
+    """
+    Run the theoretical and advanced system checks one group at a time
+    
+    Yields (group, report) pairs as each checker finishes, so callers can
+    stop early without running the remaining groups. pacing scales the
+    0.3s demo pause between groups, as in run_k1_saber_check.
+    """
+    yield "weapons", AdvancedWeaponsChecker().run_full_check()
+    
+    for group, checker in (
+        ("phase_shifting", PhaseShiftingChecker),
+        ("cloaking", CloakingSystemChecker),
+        ("teleportation", HyperLatticeTeleportationChecker),
+        ("propulsion", AdvancedPropulsionChecker),
+    ):
+        if pacing:
+            time.sleep(0.3 * pacing)
+        yield group, checker().run_check()
+
+
+def run_all_theoretical_checks(pacing: float = 0.0) -> Dict[str, any]:
+    """
+    Run all theoretical and advanced system checks
+    
+    Pass pacing=1.0 for the demo pause between checker groups; the default
+    runs without any pauses.
+    
+    Returns comprehensive status of all advanced systems
+    """
+    return dict(iter_theoretical_checks(pacing))
 
 
 if __name__ == "__main__":
-    run_all_theoretical_checks()
+    run_all_theoretical_checks(pacing=1.0)